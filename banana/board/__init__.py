@@ -2,7 +2,10 @@ from .board import Board as Board
 from .direction import ACROSS as ACROSS
 from .direction import DOWN as DOWN
 from .direction import Direction as Direction
+from .grid_board import GridBoard as GridBoard
 from .offset import Offset as Offset
+from .placement import Placement as Placement
 from .position import Position as Position
 from .tile import Tile as Tile
 from .word import Word as Word
+from .working_board import WorkingBoard as WorkingBoard
@@ -1,88 +1,443 @@
-from collections.abc import Set
+import random
+from collections.abc import Mapping, Set
 from itertools import dropwhile, takewhile
-from typing import Iterable, Iterator, Optional, override
+from typing import Iterable, Iterator, Optional, Self, Union, override
 
-from banana.board.direction import ACROSS, DOWN
+from banana.board.direction import ACROSS, DOWN, Direction
+from banana.board.placement import Placement
 from banana.board.position import Position
 from banana.board.tile import Tile
 from banana.board.word import Word
 
+_zobrist_keys = dict[Tile, int]()
+_zobrist_random = random.Random(0)
+
+
+def _zobrist_key(tile: Tile) -> int:
+    if (key := _zobrist_keys.get(tile)) is None:
+        key = _zobrist_keys[tile] = _zobrist_random.getrandbits(60)
+    return key
+
+
+# Canonical hashes are polynomial: each tile contributes key(letter) * X^x * Y^y,
+# so translating a board multiplies its hash by X^dx * Y^dy and the hash of the
+# board moved to the origin can be derived from the sum and the bounds in O(1).
+_CANONICAL_MODULUS = (1 << 61) - 1
+_CANONICAL_X = 1_000_003
+_CANONICAL_Y = 998_244_353
+_canonical_letter_keys = dict[str, int]()
+_canonical_powers = dict[tuple[int, int], int]()
+
+
+def _canonical_power(base: int, exponent: int) -> int:
+    if (power := _canonical_powers.get((base, exponent))) is None:
+        power = _canonical_powers[(base, exponent)] = pow(
+            base, exponent, _CANONICAL_MODULUS
+        )
+    return power
+
+
+def _canonical_key(letter: str, x: int, y: int) -> int:
+    if (key := _canonical_letter_keys.get(letter)) is None:
+        key = _canonical_letter_keys[letter] = _zobrist_random.randrange(
+            1, _CANONICAL_MODULUS
+        )
+    return (
+        key
+        * _canonical_power(_CANONICAL_X, x)
+        * _canonical_power(_CANONICAL_Y, y)
+        % _CANONICAL_MODULUS
+    )
+
 
 class Board(Set[Tile]):
     class Error(Exception): ...
 
     class ValueError(Error, ValueError): ...
 
+    # How far past a new minimum coordinate the bitboard origin is moved, so a
+    # board growing up or left doesn't shift every mask on each placement.
+    _ORIGIN_SLACK = 16
+    # Whether the board keeps the occupancy and anchor indexes below, rather
+    # than deriving them from its storage.
+    _INDEXED = True
+
     def __init__(self, tiles: Iterable[Tile]) -> None:
-        self._tiles = frozenset(tiles)
+        self._init_storage()
+        self._tiles: Optional[frozenset[Tile]] = None
         self._words: Optional[list[Word]] = None
-
-    def copy(self) -> "Board":
-        return Board(self._tiles)
+        self._zobrist_hash = 0
+        self._canonical_sums = (0, 0)
+        self._bounds: Optional[tuple[Position, Position]] = None
+        self._init_index()
+        if isinstance(tiles, Board):
+            self._copy_storage(tiles)
+            self._words = tiles._words
+            self._zobrist_hash = tiles._zobrist_hash
+            self._canonical_sums = tiles._canonical_sums
+            self._bounds = tiles._bounds
+            self._copy_index(tiles)
+        else:
+            for tile in tiles:
+                self._store(tile.position, tile)
+            for tile in self:
+                self._added(tile)
+
+    def _init_storage(self) -> None:
+        self._tiles_by_pos = dict[Position, Tile]()
+
+    def _copy_storage(self, board: "Board") -> None:
+        self._tiles_by_pos.update(board._tile_map())
+
+    def _tile_map(self) -> Mapping[Position, Tile]:
+        return self._tiles_by_pos
+
+    def _init_index(self) -> None:
+        # Occupancy bitboards: one int per row and per column, with bit i set
+        # when the square at coordinate origin + i is occupied.
+        self._rows = dict[int, int]()
+        self._columns = dict[int, int]()
+        self._origin = (0, 0)
+        # Tiles that are part of a word across one axis and have both
+        # neighbours free along the other, keyed by (position, direction).
+        self._anchors = dict[tuple[Position, Direction], Tile]()
+        # Whether the dicts above may be shared with a copy, which both
+        # boards then copy before their next change.
+        self._shared = False
+
+    def _copy_index(self, board: "Board") -> None:
+        if not board._INDEXED:
+            for tile in self:
+                self._index_added(tile)
+            return
+        self._rows = board._rows
+        self._columns = board._columns
+        self._origin = board._origin
+        self._anchors = board._anchors
+        self._shared = board._shared = True
+
+    def copy(self) -> Self:
+        return type(self)(self)
 
     @override
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, Board) and self._tiles == other._tiles
+        return (
+            isinstance(other, Board)
+            and self._zobrist_hash == other._zobrist_hash
+            and len(self) == len(other)
+            and all(other.tile(tile.position) == tile for tile in self)
+        )
 
     @override
     def __hash__(self) -> int:
-        return hash(self._tiles)
+        return self._zobrist_hash
 
     @override
     def __repr__(self) -> str:
-        return f"Board({self._tiles})"
+        return f"Board({self.tiles})"
 
     @override
     def __contains__(self, item: object) -> bool:
-        return item in self._tiles
+        return isinstance(item, Tile) and self.tile(item.position) == item
 
     @override
     def __iter__(self) -> Iterator[Tile]:
-        return iter(self._tiles)
+        return iter(self._tiles_by_pos.values())
 
     @override
     def __len__(self) -> int:
-        return len(self._tiles)
-
-    @property
-    def _tiles(self) -> frozenset[Tile]:
-        return self.__tiles
-
-    @_tiles.setter
-    def _tiles(self, _tiles: frozenset[Tile]) -> None:
-        self.__tiles = _tiles
-        self._tiles_by_pos = {tile.position: tile for tile in self._tiles}
+        return len(self._tiles_by_pos)
 
     @property
     def tiles(self) -> frozenset[Tile]:
+        if self._tiles is None:
+            self._tiles = frozenset(self)
         return self._tiles
 
+    @property
+    def zobrist_hash(self) -> int:
+        return self._zobrist_hash
+
     def tile(self, position: Position) -> Optional[Tile]:
         return self._tiles_by_pos.get(position, None)
 
+    def _letter(self, position: Position) -> Optional[str]:
+        tile = self._tiles_by_pos.get(position, None)
+        return tile.value if tile is not None else None
+
+    def _store(self, position: Position, tile: Optional[Tile]) -> Optional[Tile]:
+        if tile is None:
+            return self._tiles_by_pos.pop(position, None)
+        previous = self._tiles_by_pos.get(position, None)
+        self._tiles_by_pos[position] = tile
+        return previous
+
+    def _put(self, position: Position, tile: Optional[Tile]) -> Optional[Tile]:
+        previous = self._store(position, tile)
+        if previous != tile:
+            self._tiles = None
+            self._words = None
+            if previous is not None:
+                self._removed(previous)
+            if tile is not None:
+                self._added(tile)
+        return previous
+
+    def _added(self, tile: Tile) -> None:
+        x, y = tile.position.x, tile.position.y
+        self._zobrist_hash ^= _zobrist_key(tile)
+        translation_sum, transpose_sum = self._canonical_sums
+        self._canonical_sums = (
+            (translation_sum + _canonical_key(tile.value, x, y)) % _CANONICAL_MODULUS,
+            (transpose_sum + _canonical_key(tile.value, y, x)) % _CANONICAL_MODULUS,
+        )
+        if self._bounds is not None:
+            lower, upper = self._bounds
+            self._bounds = (
+                Position(x if x < lower.x else lower.x, y if y < lower.y else lower.y),
+                Position(x if x > upper.x else upper.x, y if y > upper.y else upper.y),
+            )
+        self._index_added(tile)
+
+    def _index_added(self, tile: Tile) -> None:
+        x, y = tile.position.x, tile.position.y
+        if self._shared:
+            self._unshare()
+        x0, y0 = self._origin
+        if x < x0 or y < y0:
+            self._rebase(
+                x - self._ORIGIN_SLACK if x < x0 else x0,
+                y - self._ORIGIN_SLACK if y < y0 else y0,
+            )
+            x0, y0 = self._origin
+        self._rows[y] = self._rows.get(y, 0) | 1 << (x - x0)
+        self._columns[x] = self._columns.get(x, 0) | 1 << (y - y0)
+        self._update_anchors(tile.position)
+
+    def _removed(self, tile: Tile) -> None:
+        x, y = tile.position.x, tile.position.y
+        self._zobrist_hash ^= _zobrist_key(tile)
+        translation_sum, transpose_sum = self._canonical_sums
+        self._canonical_sums = (
+            (translation_sum - _canonical_key(tile.value, x, y)) % _CANONICAL_MODULUS,
+            (transpose_sum - _canonical_key(tile.value, y, x)) % _CANONICAL_MODULUS,
+        )
+        if self._bounds is not None:
+            lower, upper = self._bounds
+            if x in (lower.x, upper.x) or y in (lower.y, upper.y):
+                self._bounds = None
+        self._index_removed(tile)
+
+    def _index_removed(self, tile: Tile) -> None:
+        x, y = tile.position.x, tile.position.y
+        if self._shared:
+            self._unshare()
+        x0, y0 = self._origin
+        if row := self._rows[y] & ~(1 << (x - x0)):
+            self._rows[y] = row
+        else:
+            del self._rows[y]
+        if column := self._columns[x] & ~(1 << (y - y0)):
+            self._columns[x] = column
+        else:
+            del self._columns[x]
+        self._update_anchors(tile.position)
+
+    def _unshare(self) -> None:
+        self._rows = self._rows.copy()
+        self._columns = self._columns.copy()
+        self._anchors = self._anchors.copy()
+        self._shared = False
+
+    def _update_anchors(self, position: Position) -> None:
+        # Whether a square is an anchor only depends on it and its neighbours.
+        for square in (
+            position,
+            position + ACROSS,
+            position - ACROSS,
+            position + DOWN,
+            position - DOWN,
+        ):
+            tile = self.tile(square) if self.occupied(square) else None
+            for direction in ACROSS, DOWN:
+                if (
+                    tile is not None
+                    and self.is_open(square, direction)
+                    and not self.is_open(square, direction.orthogonal())
+                ):
+                    self._anchors[square, direction] = tile
+                else:
+                    self._anchors.pop((square, direction), None)
+
+    def anchors(self) -> list[tuple[Tile, Direction]]:
+        return [(tile, direction) for (_, direction), tile in self._anchors.items()]
+
+    def _rebase(self, x0: int, y0: int) -> None:
+        dx = self._origin[0] - x0
+        dy = self._origin[1] - y0
+        self._rows = {y: row << dx for y, row in self._rows.items()}
+        self._columns = {x: column << dy for x, column in self._columns.items()}
+        self._origin = (x0, y0)
+
+    def _line_mask(self, position: Position, direction: Direction) -> tuple[int, int]:
+        x0, y0 = self._origin
+        if direction.dx:
+            mask, index = self._rows.get(position.y, 0), position.x - x0
+        else:
+            mask, index = self._columns.get(position.x, 0), position.y - y0
+        if index < 0:
+            return mask << -index, 0
+        return mask, index
+
+    def occupied(self, position: Position) -> bool:
+        mask, index = self._line_mask(position, ACROSS)
+        return bool(mask >> index & 1)
+
+    def is_open(self, position: Position, direction: Direction) -> bool:
+        mask, index = self._line_mask(position, direction)
+        return not (mask << 1) >> index & 0b101
+
+    def free_span(self, position: Position, direction: Direction) -> Optional[int]:
+        mask, index = self._line_mask(position, direction)
+        if direction.dx + direction.dy > 0:
+            ahead = mask >> (index + 1)
+            return (ahead & -ahead).bit_length() - 1 if ahead else None
+        behind = mask & ((1 << index) - 1)
+        return index - behind.bit_length() if behind else None
+
+    def anchor_span(
+        self, position: Position, direction: Direction, letters: int
+    ) -> tuple[int, int]:
+        # How far before and after position a word through it along direction
+        # can reach by placing at most letters tiles. Tiles in line are part of
+        # the word once it reaches them, so the span runs on through them.
+        return (
+            self._reach(position, -direction, letters),
+            self._reach(position, direction, letters),
+        )
+
+    def _reach(self, position: Position, direction: Direction, letters: int) -> int:
+        reach = 0
+        while True:
+            while self.occupied(position + direction):
+                position += direction
+                reach += 1
+            span = self.free_span(position, direction)
+            if span is None or span > letters:
+                return reach + letters
+            letters -= span
+            reach += span
+            position += direction * span
+
+    def fragments(self, position: Position, direction: Direction) -> tuple[str, str]:
+        if self.is_open(position, direction):
+            return "", ""
+        before = list[str]()
+        current = position - direction
+        while (letter := self._letter(current)) is not None:
+            before.append(letter)
+            current -= direction
+        after = list[str]()
+        current = position + direction
+        while (letter := self._letter(current)) is not None:
+            after.append(letter)
+            current += direction
+        return "".join(reversed(before)), "".join(after)
+
     def add_tile(self, tile: Tile) -> None:
-        updated = dict(self._tiles_by_pos)
-        updated[tile.position] = tile
-        self._tiles = frozenset(updated.values())
+        self._put(tile.position, tile)
 
     def remove_tile(self, tile: Tile) -> None:
         self.remove_tile_at(tile.position)
 
     def remove_tile_at(self, position: Position) -> None:
-        self._tiles = frozenset(t for t in self._tiles if t.position != position)
-
-    def can_place_word(self, word: Word) -> bool:
-        for word_tile in word:
-            if board_tile := self.tile(word_tile.position):
-                if word_tile != board_tile:
-                    return False
+        self._put(position, None)
+
+    def can_place_word(self, word: Union[Word, Placement]) -> bool:
+        mask, index = self._line_mask(word.position, word.direction)
+        # Only the squares the word shares with tiles need their letters
+        # compared: bit i of overlap is the word's i-th square.
+        overlap = mask >> index & ((1 << len(word)) - 1)
+        while overlap:
+            i = (overlap & -overlap).bit_length() - 1
+            if self._letter(word.position + word.direction * i) != word.value[i]:
+                return False
+            overlap &= overlap - 1
         return True
 
-    def place_word(self, word: Word, validate: bool = True) -> None:
+    def place_word(self, word: Union[Word, Placement], validate: bool = True) -> None:
         if validate and not self.can_place_word(word):
             raise self.ValueError(f"Cannot place word {word} on board {self}")
-        for tile in word:
-            self.add_tile(tile)
+        words = self._words
+        changed = [
+            tile.position for tile in word if self._put(tile.position, tile) != tile
+        ]
+        if words is not None:
+            self._words = self._place_words(words, word, changed)
+
+    def _line(self, position: Position, direction: Direction) -> list[Tile]:
+        while self.tile(position - direction) is not None:
+            position -= direction
+        tiles = list[Tile]()
+        while (tile := self.tile(position)) is not None:
+            tiles.append(tile)
+            position += direction
+        return tiles
+
+    def _place_words(
+        self,
+        words: list[Word],
+        word: Union[Word, Placement],
+        changed: list[Position],
+    ) -> list[Word]:
+        # Placing tiles only grows or relabels the runs through the changed
+        # positions, so every other word of the parent board is unaffected.
+        if not changed:
+            return words
+        orthogonal = word.direction.orthogonal()
+        lines = [(self._line(changed[0], word.direction), word.direction)] + [
+            (self._line(position, orthogonal), orthogonal) for position in changed
+        ]
+        covered = {
+            (tile.position, direction) for line, direction in lines for tile in line
+        }
+        return [
+            existing
+            for existing in words
+            if (existing.position, existing.direction) not in covered
+        ] + [
+            Word.trusted(line, direction) for line, direction in lines if len(line) >= 2
+        ]
+
+    def words_formed_by(self, word: Union[Word, Placement]) -> list[str]:
+        placed = dict(zip(word.positions(), word.value, strict=True))
+
+        def value(position: Position) -> Optional[str]:
+            if (letter := placed.get(position)) is not None:
+                return letter
+            return self._letter(position)
+
+        def line(position: Position, direction: Direction) -> str:
+            while value(position - direction) is not None:
+                position -= direction
+            letters = list[str]()
+            while (letter := value(position)) is not None:
+                letters.append(letter)
+                position += direction
+            return "".join(letters)
+
+        changed = [
+            position
+            for position, letter in placed.items()
+            if self._letter(position) != letter
+        ]
+        if not changed:
+            return []
+        orthogonal = word.direction.orthogonal()
+        lines = [line(word.position, word.direction)] + [
+            line(position, orthogonal) for position in changed
+        ]
+        return [line for line in lines if len(line) >= 2]
 
     def _get_words(self) -> Iterable[Word]:
         for start_tile in self:
@@ -134,7 +489,7 @@ class Board(Set[Tile]):
         starting_y = starting_pos.y if starting_pos else 0
 
         tiles = [
-            Tile(value, Position(x + starting_x, y + starting_y))
+            Tile.of(value, Position.of(x + starting_x, y + starting_y))
             for y, line in enumerate(lines)
             for x, value in enumerate(line)
             if not value.isspace()
@@ -144,9 +499,54 @@ class Board(Set[Tile]):
     def bounds(self) -> tuple[Position, Position]:
         if not self:
             return Position(0, 0), Position(0, 0)
-        xs = [pos.x for pos in self._tiles_by_pos.keys()]
-        ys = [pos.y for pos in self._tiles_by_pos.keys()]
-        return Position(min(xs), min(ys)), Position(max(xs), max(ys))
+        if self._bounds is None:
+            xs = [tile.position.x for tile in self]
+            ys = [tile.position.y for tile in self]
+            self._bounds = Position(min(xs), min(ys)), Position(max(xs), max(ys))
+        return self._bounds
+
+    def _transposed_is_canonical(self) -> bool:
+        return self._canonical_hash(transpose=True) < self._canonical_hash()
+
+    def _canonical_hash(self, transpose: bool = False) -> int:
+        lower, _ = self.bounds()
+        translation_sum, transpose_sum = self._canonical_sums
+        if transpose:
+            return (
+                transpose_sum
+                * _canonical_power(_CANONICAL_X, -lower.y)
+                * _canonical_power(_CANONICAL_Y, -lower.x)
+                % _CANONICAL_MODULUS
+            )
+        return (
+            translation_sum
+            * _canonical_power(_CANONICAL_X, -lower.x)
+            * _canonical_power(_CANONICAL_Y, -lower.y)
+            % _CANONICAL_MODULUS
+        )
+
+    def canonical_hash(self, transpose: bool = False) -> int:
+        if transpose and self._transposed_is_canonical():
+            return self._canonical_hash(transpose=True)
+        return self._canonical_hash()
+
+    def canonical(self, transpose: bool = False) -> "Board":
+        lower, _ = self.bounds()
+        if transpose and self._transposed_is_canonical():
+            return Board(
+                Tile(
+                    tile.value,
+                    Position(tile.position.y - lower.y, tile.position.x - lower.x),
+                )
+                for tile in self
+            )
+        return Board(
+            Tile(
+                tile.value,
+                Position(tile.position.x - lower.x, tile.position.y - lower.y),
+            )
+            for tile in self
+        )
 
     @override
     def __str__(self) -> str:
@@ -161,5 +561,9 @@ class Board(Set[Tile]):
             s += "\n"
         return s
 
-    def get_letters_consumed(self, word: Word) -> list[str]:
-        return [tile.value for tile in word if self.tile(tile.position) is None]
+    def get_letters_consumed(self, word: Union[Word, Placement]) -> list[str]:
+        return [
+            letter
+            for letter, position in zip(word.value, word.positions(), strict=True)
+            if self._letter(position) is None
+        ]
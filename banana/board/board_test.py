@@ -3,7 +3,7 @@ from typing import Optional
 import pytest
 from pytest_subtests import SubTests
 
-from banana.board import Board, Position, Tile, Word
+from banana.board import ACROSS, DOWN, Board, Direction, Position, Tile, Word
 
 
 def test_eq(subtests: SubTests):
@@ -364,3 +364,317 @@ def test_letters_consumed() -> None:
     board = Board([Tile("A", Position(0, 0))])
     word = Word([Tile("A", Position(0, 0)), Tile("B", Position(1, 0))])
     assert board.get_letters_consumed(word) == ["B"]
+
+
+def test_place_word_updates_words(subtests: SubTests) -> None:
+    for board_str, word, validate in list[tuple[str, Word, bool]](
+        [
+            (
+                "ABC",
+                Word.from_str("BDE", Position(1, 0), DOWN),
+                True,
+            ),
+            (
+                "ABC",
+                Word.from_str("ABC", Position(0, 0), ACROSS),
+                True,
+            ),
+            (
+                "AB DE",
+                Word.from_str("BCD", Position(1, 0), ACROSS),
+                True,
+            ),
+            (
+                """
+                AB
+                  
+                CD
+                """,
+                Word.from_str("EF", Position(0, 1), ACROSS),
+                True,
+            ),
+            (
+                """
+                A C
+                B D
+                """,
+                Word.from_str("AXC", Position(0, 0), ACROSS),
+                True,
+            ),
+            (
+                "ABC",
+                Word.from_str("XY", Position(1, 0), ACROSS),
+                False,
+            ),
+        ]
+    ):
+        with subtests.test(board_str=board_str, word=word):
+            board = Board.from_str(board_str)
+            board.get_words()
+            board.place_word(word, validate=validate)
+            assert set(board.get_words()) == set(Board(board).get_words())
+            assert set(board.get_words()) == set(Board(board.tiles).get_words())
+
+
+def test_copy_keeps_words() -> None:
+    board = Board.from_str("ABC")
+    words = board.get_words()
+    copy = board.copy()
+    assert copy.get_words() is words
+    copy.place_word(Word.from_str("BD", Position(1, 0), DOWN))
+    assert board.get_words() is words
+    assert {word.value for word in copy.get_words()} == {"ABC", "BD"}
+
+
+def test_words_formed_by(subtests: SubTests) -> None:
+    for board_str, word, expected in list[tuple[str, Word, list[str]]](
+        [
+            (
+                "ABC",
+                Word.from_str("ABC", Position(0, 0), ACROSS),
+                [],
+            ),
+            (
+                "ABC",
+                Word.from_str("BDE", Position(1, 0), DOWN),
+                ["BDE"],
+            ),
+            (
+                "ABC",
+                Word.from_str("DE", Position(1, 1), ACROSS),
+                ["DE", "BD", "CE"],
+            ),
+            (
+                "AB DE",
+                Word.from_str("BC", Position(1, 0), ACROSS),
+                ["ABCDE"],
+            ),
+            (
+                "A",
+                Word.from_str("XY", Position(0, -2), DOWN),
+                ["XYA"],
+            ),
+        ]
+    ):
+        with subtests.test(board_str=board_str, word=word):
+            board = Board.from_str(board_str)
+            assert board.words_formed_by(word) == expected
+            assert board == Board.from_str(board_str)
+
+
+def test_zobrist_hash() -> None:
+    board = Board.from_str("AB")
+    assert board.zobrist_hash == hash(board)
+    assert board.zobrist_hash == Board.from_str("AB").zobrist_hash
+    assert board.zobrist_hash != Board.from_str("BA").zobrist_hash
+    board.place_word(Word.from_str("BC", Position(1, 0), DOWN))
+    assert board.zobrist_hash == Board(board.tiles).zobrist_hash
+    board.add_tile(Tile("D", Position(1, 1)))
+    assert board.zobrist_hash == Board(board.tiles).zobrist_hash
+    board.remove_tile_at(Position(1, 1))
+    assert board.zobrist_hash == Board.from_str("AB").zobrist_hash
+    assert Board([]).zobrist_hash == 0
+
+
+def test_canonical() -> None:
+    board = Board.from_str(
+        """
+        AB
+         C
+        """,
+        starting_pos=Position(-3, 5),
+    )
+    assert board.canonical() == Board.from_str(
+        """
+        AB
+         C
+        """
+    )
+    assert board.canonical_hash() == board.canonical().canonical_hash()
+    assert Board([]).canonical() == Board([])
+
+
+def test_canonical_transpose() -> None:
+    across = Board.from_str("AB", starting_pos=Position(2, 2))
+    down = Board.from_str(
+        """
+        A
+        B
+        """,
+        starting_pos=Position(-1, 4),
+    )
+    assert across.canonical_hash() != down.canonical_hash()
+    assert across.canonical_hash(transpose=True) == down.canonical_hash(transpose=True)
+    assert across.canonical(transpose=True) == down.canonical(transpose=True)
+    assert across.canonical(transpose=True).canonical_hash() == (
+        across.canonical_hash(transpose=True)
+    )
+
+
+def test_canonical_hash_tracks_changes(subtests: SubTests) -> None:
+    board = Board.from_str("ABC", starting_pos=Position(4, -2))
+    for change in list[Tile](
+        [
+            Tile("D", Position(3, -2)),
+            Tile("E", Position(4, -3)),
+            Tile("F", Position(4, -2)),
+        ]
+    ):
+        with subtests.test(change=change):
+            board.add_tile(change)
+            assert board.canonical_hash(transpose=True) == (
+                Board(board.tiles).canonical().canonical_hash(transpose=True)
+            )
+            assert board.bounds() == Board(board.tiles).bounds()
+    board.remove_tile_at(Position(3, -2))
+    assert board.canonical_hash() == Board(board.tiles).canonical().canonical_hash()
+    assert board.bounds() == Board(board.tiles).bounds()
+
+
+def test_occupancy(subtests: SubTests) -> None:
+    board = Board.from_str(
+        """
+        A  B
+           C
+        """,
+        starting_pos=Position(-20, -30),
+    )
+    board.add_tile(Tile("D", Position(-40, -60)))
+    board.remove_tile_at(Position(-40, -60))
+    for position, direction, occupied, is_open, free_span in list[
+        tuple[Position, Direction, bool, bool, Optional[int]]
+    ](
+        [
+            (Position(-20, -30), ACROSS, True, True, 2),
+            (Position(-19, -30), ACROSS, False, False, 1),
+            (Position(-18, -30), -ACROSS, False, False, 1),
+            (Position(-17, -30), DOWN, True, False, 0),
+            (Position(-17, -30), -DOWN, True, False, None),
+            (Position(-17, -29), DOWN, True, False, None),
+            (Position(-20, -30), -ACROSS, True, True, None),
+            (Position(-100, -30), ACROSS, False, True, 79),
+            (Position(-17, -100), DOWN, False, True, 69),
+            (Position(-40, -60), ACROSS, False, True, None),
+            (Position(5, 5), DOWN, False, True, None),
+        ]
+    ):
+        with subtests.test(position=position, direction=direction):
+            assert board.occupied(position) == occupied
+            assert board.is_open(position, direction) == is_open
+            assert board.free_span(position, direction) == free_span
+
+
+def test_anchor_span(subtests: SubTests) -> None:
+    board = Board.from_str(
+        """
+        ABC
+
+            D
+          E
+        """
+    )
+    for position, direction, letters, expected in list[
+        tuple[Position, Direction, int, tuple[int, int]]
+    ](
+        [
+            (Position(0, 0), DOWN, 2, (2, 2)),
+            (Position(2, 0), DOWN, 2, (2, 3)),
+            (Position(2, 0), DOWN, 1, (1, 1)),
+            (Position(0, 0), ACROSS, 2, (2, 4)),
+            (Position(4, 2), ACROSS, 2, (2, 2)),
+            (Position(2, 3), DOWN, 2, (3, 2)),
+            (Position(2, 3), -DOWN, 2, (2, 3)),
+            (Position(3, 0), ACROSS, 2, (5, 2)),
+        ]
+    ):
+        with subtests.test(position=position, direction=direction, letters=letters):
+            assert board.anchor_span(position, direction, letters) == expected
+
+
+def test_occupancy_copy() -> None:
+    board = Board.from_str("AB")
+    copy = board.copy()
+    copy.remove_tile_at(Position(0, 0))
+    assert board.occupied(Position(0, 0))
+    assert not copy.occupied(Position(0, 0))
+
+
+def test_occupancy_copy_of_changed_board() -> None:
+    board = Board.from_str("AB")
+    copy = board.copy()
+    board.add_tile(Tile("C", Position(0, 1)))
+    assert not copy.occupied(Position(0, 1))
+    assert set(copy.anchors()) == _scanned_anchors(copy)
+    assert set(board.anchors()) == _scanned_anchors(board)
+
+
+def test_can_place_word_over_empty_squares() -> None:
+    board = Board.from_str("A  B", starting_pos=Position(-5, 0))
+    assert board.can_place_word(Word.from_str("XY", Position(-4, 0), ACROSS))
+    assert board.can_place_word(Word.from_str("AXYB", Position(-5, 0), ACROSS))
+    assert not board.can_place_word(Word.from_str("XYZ", Position(-4, 0), ACROSS))
+    assert board.can_place_word(Word.from_str("XYZ", Position(-9, 0), ACROSS))
+
+
+def test_fragments(subtests: SubTests) -> None:
+    board = Board.from_str(
+        """
+        AB D
+          E
+        """
+    )
+    for position, direction, expected in list[
+        tuple[Position, Direction, tuple[str, str]]
+    ](
+        [
+            (Position(2, 0), ACROSS, ("AB", "D")),
+            (Position(2, 0), DOWN, ("", "E")),
+            (Position(4, 0), ACROSS, ("D", "")),
+            (Position(2, 2), ACROSS, ("", "")),
+        ]
+    ):
+        with subtests.test(position=position, direction=direction):
+            assert board.fragments(position, direction) == expected
+
+
+def _scanned_anchors(board: Board) -> set[tuple[Tile, Direction]]:
+    anchors = set[tuple[Tile, Direction]]()
+    for word in board.get_words():
+        direction = word.direction.orthogonal()
+        for tile in word:
+            if board.tile(tile.position + direction) is None and (
+                board.tile(tile.position - direction) is None
+            ):
+                anchors.add((tile, direction))
+    return anchors
+
+
+def test_anchors(subtests: SubTests) -> None:
+    board = Board.from_str(
+        """
+        ABC
+          D
+        """
+    )
+    assert set(board.anchors()) == {
+        (Tile("A", Position(0, 0)), DOWN),
+        (Tile("B", Position(1, 0)), DOWN),
+        (Tile("D", Position(2, 1)), ACROSS),
+    }
+    for change, place in list[tuple[Tile, bool]](
+        [
+            (Tile("E", Position(1, 1)), True),
+            (Tile("F", Position(1, 1)), True),
+            (Tile("G", Position(3, 0)), True),
+            (Tile("H", Position(-5, -5)), True),
+            (Tile("F", Position(1, 1)), False),
+            (Tile("C", Position(2, 0)), False),
+        ]
+    ):
+        with subtests.test(change=change, place=place):
+            if place:
+                board.add_tile(change)
+            else:
+                board.remove_tile(change)
+            assert set(board.anchors()) == _scanned_anchors(board)
+            assert set(board.copy().anchors()) == _scanned_anchors(board)
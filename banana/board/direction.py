@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import override
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Direction:
     dx: int
     dy: int
@@ -30,19 +30,36 @@ class Direction:
                 return f"Direction({self.dx}, {self.dy})"
 
     def __add__(self, rhs: "position.Position") -> "position.Position":
-        return position.Position(rhs.x + self.dx, rhs.y + self.dy)
+        return position.Position.of(rhs.x + self.dx, rhs.y + self.dy)
 
     def __neg__(self) -> "Direction":
-        return Direction(-self.dx, -self.dy)
+        return _NEGATED[self.dx, self.dy]
 
     def __mul__(self, rhs: int) -> "offset.Offset":
-        return offset.Offset(self.dx * rhs, self.dy * rhs)
+        return offset.Offset.of(self.dx * rhs, self.dy * rhs)
 
     def orthogonal(self) -> "Direction":
-        return Direction(self.dy, self.dx)
+        return _ORTHOGONAL[self.dx, self.dy]
 
 
 ACROSS = Direction(1, 0)
 DOWN = Direction(0, 1)
 
+# Every valid direction is one of these four, so negation and rotation are
+# table lookups rather than new, re-validated instances.
+_BACK_ACROSS = Direction(-1, 0)
+_BACK_DOWN = Direction(0, -1)
+_NEGATED = {
+    (1, 0): _BACK_ACROSS,
+    (0, 1): _BACK_DOWN,
+    (-1, 0): ACROSS,
+    (0, -1): DOWN,
+}
+_ORTHOGONAL = {
+    (1, 0): DOWN,
+    (0, 1): ACROSS,
+    (-1, 0): _BACK_DOWN,
+    (0, -1): _BACK_ACROSS,
+}
+
 from banana.board import offset, position  # noqa: E402
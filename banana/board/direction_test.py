@@ -24,11 +24,17 @@ def test_sub():
 def test_neg():
     assert -ACROSS == Direction(-1, 0)
     assert -DOWN == Direction(0, -1)
+    back = -ACROSS
+    assert -back is ACROSS
+    assert -Direction(0, 1) is -DOWN
 
 
 def test_orthogonal():
     assert ACROSS.orthogonal() == DOWN
     assert DOWN.orthogonal() == ACROSS
+    assert (-ACROSS).orthogonal() == -DOWN
+    assert (-DOWN).orthogonal() == -ACROSS
+    assert Direction(1, 0).orthogonal() is DOWN
 
 
 def test_mul() -> None:
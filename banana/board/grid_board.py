@@ -0,0 +1,262 @@
+import re
+from typing import Iterable, Iterator, Mapping, Optional, Union, override
+
+from banana.board.board import Board
+from banana.board.direction import ACROSS, DOWN, Direction
+from banana.board.placement import Placement
+from banana.board.position import Position
+from banana.board.tile import Tile
+from banana.board.word import Word
+
+_RUN = re.compile(rb"[^\x00]{2,}")
+_TILE = re.compile(rb"[^\x00]")
+
+
+class GridBoard(Board):
+    # Extra rows and columns allocated on each side when the grid grows, so a
+    # board built up one word at a time doesn't reallocate on every placement.
+    _PADDING = 4
+    # Occupancy and anchors are read off the grid instead.
+    _INDEXED = False
+
+    @override
+    def __repr__(self) -> str:
+        return f"GridBoard({self.tiles})"
+
+    @override
+    def _init_storage(self) -> None:
+        self._grid = bytearray()
+        self._x0 = 0
+        self._y0 = 0
+        self._width = 0
+        self._height = 0
+        self._count = 0
+
+    @override
+    def _copy_storage(self, board: Board) -> None:
+        if isinstance(board, GridBoard):
+            self._grid = board._grid.copy()
+            self._x0 = board._x0
+            self._y0 = board._y0
+            self._width = board._width
+            self._height = board._height
+            self._count = board._count
+        else:
+            for tile in board:
+                self._store(tile.position, tile)
+
+    @override
+    def _init_index(self) -> None:
+        pass
+
+    @override
+    def _copy_index(self, board: Board) -> None:
+        pass
+
+    @override
+    def _index_added(self, tile: Tile) -> None:
+        pass
+
+    @override
+    def _index_removed(self, tile: Tile) -> None:
+        pass
+
+    @override
+    def _tile_map(self) -> Mapping[Position, Tile]:
+        return {tile.position: tile for tile in self}
+
+    def _index(self, x: int, y: int) -> Optional[int]:
+        x -= self._x0
+        y -= self._y0
+        if 0 <= x < self._width and 0 <= y < self._height:
+            return y * self._width + x
+        return None
+
+    def _grow(self, x: int, y: int) -> None:
+        if not self._width:
+            x0, y0, x1, y1 = x, y, x, y
+        else:
+            x0 = x - self._PADDING if x < self._x0 else self._x0
+            y0 = y - self._PADDING if y < self._y0 else self._y0
+            x1 = self._x0 + self._width - 1
+            y1 = self._y0 + self._height - 1
+            x1 = x + self._PADDING if x > x1 else x1
+            y1 = y + self._PADDING if y > y1 else y1
+        width = x1 - x0 + 1
+        height = y1 - y0 + 1
+        grid = bytearray(width * height)
+        for row in range(self._height):
+            start = (row + self._y0 - y0) * width + self._x0 - x0
+            grid[start : start + self._width] = self._grid[
+                row * self._width : (row + 1) * self._width
+            ]
+        self._grid = grid
+        self._x0 = x0
+        self._y0 = y0
+        self._width = width
+        self._height = height
+
+    @override
+    def __iter__(self) -> Iterator[Tile]:
+        grid = self._grid
+        width = self._width
+        for y in range(self._height):
+            row = y * width
+            for x in range(width):
+                if value := grid[row + x]:
+                    yield Tile.of(chr(value), Position.of(self._x0 + x, self._y0 + y))
+
+    @override
+    def __len__(self) -> int:
+        return self._count
+
+    @override
+    def tile(self, position: Position) -> Optional[Tile]:
+        if (value := self._value(position.x, position.y)) is not None:
+            return Tile.of(value, position)
+        return None
+
+    def _value(self, x: int, y: int) -> Optional[str]:
+        index = self._index(x, y)
+        if index is None or not (value := self._grid[index]):
+            return None
+        return chr(value)
+
+    @override
+    def _letter(self, position: Position) -> Optional[str]:
+        return self._value(position.x, position.y)
+
+    @override
+    def _store(self, position: Position, tile: Optional[Tile]) -> Optional[Tile]:
+        previous = self.tile(position)
+        if tile is None:
+            if previous is not None:
+                index = self._index(position.x, position.y)
+                assert index is not None
+                self._grid[index] = 0
+                self._count -= 1
+            return previous
+        if len(tile.value) != 1 or ord(tile.value) > 0xFF:
+            raise self.ValueError(f"GridBoard can't store tile {tile}")
+        index = self._index(position.x, position.y)
+        if index is None:
+            self._grow(position.x, position.y)
+            index = self._index(position.x, position.y)
+            assert index is not None
+        self._grid[index] = ord(tile.value)
+        if previous is None:
+            self._count += 1
+        return previous
+
+    def _grid_line(
+        self, position: Position, direction: Direction
+    ) -> tuple[bytearray, int]:
+        # The grid's row or column through position along direction, and
+        # position's index in it, which may lie outside it.
+        x = position.x - self._x0
+        y = position.y - self._y0
+        if direction.dx:
+            if not 0 <= y < self._height:
+                return bytearray(), x
+            return self._grid[y * self._width : (y + 1) * self._width], x
+        if not 0 <= x < self._width:
+            return bytearray(), y
+        return self._grid[x :: self._width], y
+
+    @override
+    def occupied(self, position: Position) -> bool:
+        index = self._index(position.x, position.y)
+        return index is not None and self._grid[index] != 0
+
+    @override
+    def is_open(self, position: Position, direction: Direction) -> bool:
+        return not self.occupied(position + direction) and not self.occupied(
+            position - direction
+        )
+
+    @override
+    def free_span(self, position: Position, direction: Direction) -> Optional[int]:
+        line, index = self._grid_line(position, direction)
+        if direction.dx + direction.dy > 0:
+            start = max(index + 1, 0)
+            ahead = line[start:]
+            if not (rest := ahead.lstrip(b"\0")):
+                return None
+            return start - index - 1 + len(ahead) - len(rest)
+        behind = line[: max(index, 0)].rstrip(b"\0")
+        return index - len(behind) if behind else None
+
+    @override
+    def anchors(self) -> list[tuple[Tile, Direction]]:
+        grid = self._grid
+        width = self._width
+        height = self._height
+
+        def occupied(x: int, y: int) -> bool:
+            return 0 <= x < width and 0 <= y < height and grid[y * width + x] != 0
+
+        anchors = list[tuple[Tile, Direction]]()
+        for match in _TILE.finditer(grid):
+            y, x = divmod(match.start(), width)
+            across = occupied(x - 1, y) or occupied(x + 1, y)
+            down = occupied(x, y - 1) or occupied(x, y + 1)
+            if across == down:
+                continue
+            tile = Tile.of(
+                chr(grid[match.start()]), Position.of(self._x0 + x, self._y0 + y)
+            )
+            anchors.append((tile, DOWN if across else ACROSS))
+        return anchors
+
+    @override
+    def can_place_word(self, word: Union[Word, Placement]) -> bool:
+        line, index = self._grid_line(word.position, word.direction)
+        start = max(index, 0)
+        covered = line[start : index + len(word)]
+        if not covered.strip(b"\0"):
+            return True
+        letters = word.value[start - index : start - index + len(covered)]
+        return all(
+            not value or value == ord(letter)
+            for value, letter in zip(covered, letters, strict=True)
+        )
+
+    @override
+    def _get_words(self) -> Iterable[Word]:
+        width = self._width
+        for y in range(self._height):
+            row = self._grid[y * width : (y + 1) * width]
+            for run in _RUN.finditer(row):
+                yield Word(
+                    Tile.of(
+                        chr(value),
+                        Position.of(self._x0 + run.start() + i, self._y0 + y),
+                    )
+                    for i, value in enumerate(run.group())
+                )
+        for x in range(width):
+            column = self._grid[x::width]
+            for run in _RUN.finditer(column):
+                yield Word(
+                    Tile.of(
+                        chr(value),
+                        Position.of(self._x0 + x, self._y0 + run.start() + i),
+                    )
+                    for i, value in enumerate(run.group())
+                )
+
+    @override
+    def __str__(self) -> str:
+        lower, upper = self.bounds()
+        if not self:
+            return " \n"
+        s = ""
+        for y in range(lower.y - self._y0, upper.y - self._y0 + 1):
+            start = y * self._width
+            s += (
+                self._grid[start + lower.x - self._x0 : start + upper.x - self._x0 + 1]
+                .replace(b"\0", b" ")
+                .decode("latin-1")
+            )
+            s += "\n"
+        return s
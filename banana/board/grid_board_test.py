@@ -0,0 +1,162 @@
+import pytest
+from pytest_subtests import SubTests
+
+from banana.board import ACROSS, DOWN, Board, GridBoard, Position, Tile, Word
+
+_BOARD = """
+    ABC
+
+    DEF
+     G
+     HKL
+"""
+
+
+def test_eq() -> None:
+    assert GridBoard([]) == Board([])
+    assert GridBoard(Board.from_str(_BOARD)) == Board.from_str(_BOARD)
+    assert GridBoard.from_str(_BOARD) == Board.from_str(_BOARD)
+    assert GridBoard.from_str("AB") != Board.from_str("BA")
+    assert hash(GridBoard.from_str(_BOARD)) == hash(Board.from_str(_BOARD))
+
+
+def test_iter_len_tiles() -> None:
+    board = GridBoard.from_str(_BOARD, starting_pos=Position(-5, 3))
+    expected = Board.from_str(_BOARD, starting_pos=Position(-5, 3))
+    assert set(board) == set(expected)
+    assert len(board) == len(expected)
+    assert board.tiles == expected.tiles
+
+
+def test_tile() -> None:
+    board = GridBoard.from_str("AB")
+    assert board.tile(Position(0, 0)) == Tile("A", Position(0, 0))
+    assert board.tile(Position(2, 0)) is None
+    assert board.tile(Position(-100, 100)) is None
+    assert Tile("B", Position(1, 0)) in board
+    assert Tile("C", Position(1, 0)) not in board
+
+
+def test_add_and_remove_tile() -> None:
+    board = GridBoard([])
+    for tile in [
+        Tile("A", Position(0, 0)),
+        Tile("B", Position(-7, 0)),
+        Tile("C", Position(0, 9)),
+        Tile("D", Position(12, -3)),
+    ]:
+        board.add_tile(tile)
+    assert set(board) == {
+        Tile("A", Position(0, 0)),
+        Tile("B", Position(-7, 0)),
+        Tile("C", Position(0, 9)),
+        Tile("D", Position(12, -3)),
+    }
+    assert board.bounds() == (Position(-7, -3), Position(12, 9))
+    board.add_tile(Tile("E", Position(0, 0)))
+    assert board.tile(Position(0, 0)) == Tile("E", Position(0, 0))
+    assert len(board) == 4
+    board.remove_tile_at(Position(-7, 0))
+    board.remove_tile_at(Position(-7, 0))
+    board.remove_tile_at(Position(100, 0))
+    assert len(board) == 3
+    assert board.bounds() == (Position(0, -3), Position(12, 9))
+
+
+def test_invalid_tile() -> None:
+    with pytest.raises(GridBoard.ValueError):
+        GridBoard([Tile("AB", Position(0, 0))])
+    with pytest.raises(GridBoard.ValueError):
+        GridBoard([Tile("Ā", Position(0, 0))])
+
+
+def test_copy() -> None:
+    board = GridBoard.from_str(_BOARD)
+    copy = board.copy()
+    assert isinstance(copy, GridBoard)
+    assert copy == board
+    copy.add_tile(Tile("Z", Position(10, 10)))
+    assert copy != board
+    assert type(Board(board)) is Board
+    assert Board(board) == board
+
+
+def test_can_place_word(subtests: SubTests) -> None:
+    for word in [
+        Word.from_str("ABC", Position(0, 0), ACROSS),
+        Word.from_str("AXE", Position(0, 0), DOWN),
+        Word.from_str("XB", Position(0, 0), ACROSS),
+        Word.from_str("QQ", Position(-10, -10), ACROSS),
+        Word.from_str("QQ", Position(10, 10), DOWN),
+        Word.from_str("QQABC", Position(-2, 0), ACROSS),
+        Word.from_str("QDQ", Position(0, -1), DOWN),
+        Word.from_str("QEQ", Position(0, -1), DOWN),
+        Word.from_str("QGHQ", Position(1, 2), DOWN),
+    ]:
+        with subtests.test(word=word):
+            assert GridBoard.from_str(_BOARD).can_place_word(word) == (
+                Board.from_str(_BOARD).can_place_word(word)
+            )
+
+
+def test_get_words() -> None:
+    assert set(GridBoard.from_str(_BOARD).get_words()) == set(
+        Board.from_str(_BOARD).get_words()
+    )
+
+
+def test_place_word() -> None:
+    board = GridBoard.from_str("ABC")
+    board.get_words()
+    board.place_word(Word.from_str("BDE", Position(1, -2), DOWN), validate=False)
+    expected = Board.from_str("ABC")
+    expected.place_word(Word.from_str("BDE", Position(1, -2), DOWN), validate=False)
+    assert board == expected
+    assert set(board.get_words()) == set(expected.get_words())
+    assert board.words_formed_by(Word.from_str("EF", Position(1, 0), ACROSS)) == (
+        expected.words_formed_by(Word.from_str("EF", Position(1, 0), ACROSS))
+    )
+
+
+def test_str() -> None:
+    assert str(GridBoard([])) == str(Board([]))
+    board = GridBoard.from_str(_BOARD, starting_pos=Position(3, -2))
+    board.add_tile(Tile("Z", Position(30, 30)))
+    board.remove_tile_at(Position(30, 30))
+    assert str(board) == str(Board.from_str(_BOARD))
+
+
+def test_anchors() -> None:
+    board = GridBoard.from_str("ABC")
+    board.place_word(Word.from_str("CDE", Position(2, 0), DOWN))
+    assert set(board.anchors()) == set(Board(board.tiles).anchors())
+    assert set(GridBoard.from_str(_BOARD).anchors()) == set(
+        Board.from_str(_BOARD).anchors()
+    )
+
+
+def test_occupancy(subtests: SubTests) -> None:
+    board = GridBoard.from_str(_BOARD, starting_pos=Position(-2, 1))
+    expected = Board.from_str(_BOARD, starting_pos=Position(-2, 1))
+    for x in range(-12, 12):
+        for y in range(-8, 14):
+            position = Position(x, y)
+            with subtests.test(position=position):
+                assert board.occupied(position) == expected.occupied(position)
+                for direction in ACROSS, DOWN, -ACROSS, -DOWN:
+                    assert board.is_open(position, direction) == (
+                        expected.is_open(position, direction)
+                    )
+                    assert board.free_span(position, direction) == (
+                        expected.free_span(position, direction)
+                    )
+                    assert board.anchor_span(position, direction, 3) == (
+                        expected.anchor_span(position, direction, 3)
+                    )
+
+
+def test_copy_to_board() -> None:
+    board = Board(GridBoard.from_str(_BOARD))
+    expected = Board.from_str(_BOARD)
+    assert set(board.anchors()) == set(expected.anchors())
+    assert board.free_span(Position(0, 0), DOWN) == 1
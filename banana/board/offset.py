@@ -1,12 +1,18 @@
 from dataclasses import dataclass
+from functools import cache
 from typing import Union, overload
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Offset:
     dx: int
     dy: int
 
+    @cache
+    @staticmethod
+    def of(dx: int, dy: int) -> "Offset":
+        return Offset(dx, dy)
+
     @overload
     def __add__(self, rhs: "Offset") -> "Offset": ...
 
@@ -25,15 +31,15 @@ class Offset:
     ]:
         match rhs:
             case Offset():
-                return Offset(self.dx + rhs.dx, self.dy + rhs.dy)
+                return Offset.of(self.dx + rhs.dx, self.dy + rhs.dy)
             case position.Position():
-                return position.Position(self.dx + rhs.x, self.dy + rhs.y)
+                return position.Position.of(self.dx + rhs.x, self.dy + rhs.y)
 
     def __mul__(self, rhs: int) -> "Offset":
-        return Offset(self.dx * rhs, self.dy * rhs)
+        return Offset.of(self.dx * rhs, self.dy * rhs)
 
     def __neg__(self) -> "Offset":
-        return Offset(-self.dx, -self.dy)
+        return Offset.of(-self.dx, -self.dy)
 
 
 from banana.board import position  # noqa: E402
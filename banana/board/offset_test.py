@@ -15,3 +15,9 @@ def test_mul() -> None:
 
 def test_neg() -> None:
     assert -Offset(1, 2) == Offset(-1, -2)
+
+
+def test_of_interns() -> None:
+    assert Offset.of(1, 2) is Offset.of(1, 2)
+    assert -Offset(1, 2) is Offset.of(-1, -2)
+    assert Offset(1, 2) * 3 is Offset.of(3, 6)
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+from banana.board.direction import Direction
+from banana.board.position import Position
+from banana.board.tile import Tile
+from banana.board.word import Word
+
+
+@dataclass(frozen=True, slots=True)
+class Placement:
+    value: str
+    position: Position
+    direction: Direction
+
+    @staticmethod
+    def from_word(word: Word) -> "Placement":
+        return Placement(word.value, word.position, word.direction)
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __iter__(self) -> Iterator[Tile]:
+        for letter, position in zip(self.value, self.positions(), strict=True):
+            yield Tile.of(letter, position)
+
+    def positions(self) -> Iterator[Position]:
+        position = self.position
+        for _ in self.value:
+            yield position
+            position += self.direction
+
+    def to_word(self) -> Word:
+        return Word.trusted(self, self.direction)
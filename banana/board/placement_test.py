@@ -0,0 +1,45 @@
+from banana.board import ACROSS, DOWN, Board, Placement, Position, Tile, Word
+
+
+def test_len() -> None:
+    assert len(Placement("ABC", Position(0, 0), ACROSS)) == 3
+
+
+def test_iter() -> None:
+    assert list(Placement("AB", Position(1, 2), DOWN)) == [
+        Tile("A", Position(1, 2)),
+        Tile("B", Position(1, 3)),
+    ]
+
+
+def test_positions() -> None:
+    assert list(Placement("ABC", Position(-1, 0), ACROSS).positions()) == [
+        Position(-1, 0),
+        Position(0, 0),
+        Position(1, 0),
+    ]
+
+
+def test_word_round_trip() -> None:
+    word = Word.from_str("ABC", Position(2, -1), DOWN)
+    placement = Placement.from_word(word)
+    assert placement == Placement("ABC", Position(2, -1), DOWN)
+    assert placement.to_word() == word
+    assert placement.to_word().direction == DOWN
+
+
+def test_board_accepts_placements() -> None:
+    board = Board.from_str("ABC")
+    placement = Placement("BDE", Position(1, 0), DOWN)
+    assert board.can_place_word(placement)
+    assert not board.can_place_word(Placement("XY", Position(1, 0), DOWN))
+    assert board.get_letters_consumed(placement) == ["D", "E"]
+    assert board.words_formed_by(placement) == ["BDE"]
+    board.place_word(placement)
+    assert board == Board.from_str(
+        """
+        ABC
+         D
+         E
+        """
+    )
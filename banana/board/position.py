@@ -1,17 +1,23 @@
 from dataclasses import dataclass
+from functools import cache
 from typing import Union
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Position:
     x: int
     y: int
 
+    @cache
+    @staticmethod
+    def of(x: int, y: int) -> "Position":
+        return Position(x, y)
+
     def __add__(self, rhs: Union["direction.Direction", "offset.Offset"]) -> "Position":
-        return Position(self.x + rhs.dx, self.y + rhs.dy)
+        return Position.of(self.x + rhs.dx, self.y + rhs.dy)
 
     def __sub__(self, rhs: Union["direction.Direction", "offset.Offset"]) -> "Position":
-        return self + (-rhs)
+        return Position.of(self.x - rhs.dx, self.y - rhs.dy)
 
 
 from banana.board import direction, offset  # noqa: E402
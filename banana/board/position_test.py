@@ -15,3 +15,18 @@ def test_sub_direction() -> None:
 
 def test_sub_offset() -> None:
     assert Position(1, 2) - Offset(3, 4) == Position(-2, -2)
+
+
+def test_of_interns() -> None:
+    assert Position.of(1, 2) is Position.of(1, 2)
+    assert Position.of(1, 2) == Position(1, 2)
+
+
+def test_arithmetic_interns() -> None:
+    assert Position(1, 1) + ACROSS is Position.of(2, 1)
+    assert Position(1, 1) - ACROSS is Position.of(0, 1)
+    assert Position(1, 2) + Offset(3, 4) is Position.of(4, 6)
+
+
+def test_slots() -> None:
+    assert not hasattr(Position(0, 0), "__dict__")
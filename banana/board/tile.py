@@ -1,9 +1,15 @@
 from dataclasses import dataclass
+from functools import cache
 
 from banana.board.position import Position
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Tile:
     value: str
     position: Position
+
+    @cache
+    @staticmethod
+    def of(value: str, position: Position) -> "Tile":
+        return Tile(value, position)
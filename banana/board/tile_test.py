@@ -3,3 +3,13 @@ from banana.board import Position, Tile
 
 def test_ctor():
     assert Tile("A", Position(0, 0)).value == "A"
+
+
+def test_of_interns() -> None:
+    assert Tile.of("A", Position(0, 0)) is Tile.of("A", Position(0, 0))
+    assert Tile.of("A", Position(0, 0)) == Tile("A", Position(0, 0))
+    assert Tile.of("A", Position(0, 0)) is not Tile.of("B", Position(0, 0))
+
+
+def test_slots() -> None:
+    assert not hasattr(Tile("A", Position(0, 0)), "__dict__")
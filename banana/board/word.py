@@ -25,10 +25,21 @@ class Word(Sized, Iterable[Tile]):
             for i in range(len(self._tiles) - 1)
         ):
             raise self.ValueError(f"Word {self!r} has non-linear tiles")
+        self._init(direction)
+
+    def _init(self, direction: Direction) -> None:
         self.direction = direction
         self.value = "".join(tile.value for tile in self)
         self.position = self._tiles[0].position
 
+    @classmethod
+    def trusted(cls, tiles: Iterable[Tile], direction: Direction) -> "Word":
+        # For callers that built the tiles in a line along direction themselves.
+        word = cls.__new__(cls)
+        word._tiles = tuple(tiles)
+        word._init(direction)
+        return word
+
     @override
     def __repr__(self) -> str:
         return f"Word({self._tiles})"
@@ -57,6 +68,9 @@ class Word(Sized, Iterable[Tile]):
     def __iter__(self) -> Iterator[Tile]:
         return iter(self._tiles)
 
+    def positions(self) -> Iterator[Position]:
+        return (tile.position for tile in self._tiles)
+
     def overlaps(self, rhs: "Word") -> bool:
         return bool(set(self) & set(rhs))
 
@@ -69,6 +83,6 @@ class Word(Sized, Iterable[Tile]):
     ) -> "Word":
         tiles = list[Tile]()
         for char in word_str:
-            tiles.append(Tile(char, position))
+            tiles.append(Tile.of(char, position))
             position += direction
         return cls(tiles)
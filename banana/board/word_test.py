@@ -158,3 +158,19 @@ def test_from_str() -> None:
             Tile("B", Position(1, 0)),
         ]
     )
+
+
+def test_trusted() -> None:
+    tiles = [Tile("A", Position(0, 0)), Tile("B", Position(0, 1))]
+    word = Word.trusted(tiles, DOWN)
+    assert word == Word(tiles)
+    assert word.direction == DOWN
+    assert word.value == "AB"
+    assert word.position == Position(0, 0)
+
+
+def test_positions() -> None:
+    assert list(Word.from_str("AB", Position(0, 0), ACROSS).positions()) == [
+        Position(0, 0),
+        Position(1, 0),
+    ]
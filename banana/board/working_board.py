@@ -0,0 +1,65 @@
+from typing import Iterable, Optional, Union, override
+
+from banana.board.board import Board
+from banana.board.placement import Placement
+from banana.board.position import Position
+from banana.board.tile import Tile
+from banana.board.word import Word
+
+
+class WorkingBoard(Board):
+    class UndoError(Board.Error, RuntimeError): ...
+
+    def __init__(self, tiles: Iterable[Tile]) -> None:
+        super().__init__(tiles)
+        self._journal = list[
+            tuple[
+                list[tuple[Position, Optional[Tile]]],
+                Optional[list[Word]],
+            ]
+        ]()
+
+    @override
+    def __repr__(self) -> str:
+        return f"WorkingBoard({self.tiles})"
+
+    def freeze(self) -> Board:
+        return Board(self)
+
+    @property
+    def depth(self) -> int:
+        return len(self._journal)
+
+    def _begin(self) -> None:
+        self._journal.append(([], self._words))
+
+    @override
+    def _put(self, position: Position, tile: Optional[Tile]) -> Optional[Tile]:
+        previous = super()._put(position, tile)
+        self._journal[-1][0].append((position, previous))
+        return previous
+
+    @override
+    def add_tile(self, tile: Tile) -> None:
+        self._begin()
+        super().add_tile(tile)
+
+    @override
+    def remove_tile_at(self, position: Position) -> None:
+        self._begin()
+        super().remove_tile_at(position)
+
+    @override
+    def place_word(self, word: Union[Word, Placement], validate: bool = True) -> None:
+        if validate and not self.can_place_word(word):
+            raise self.ValueError(f"Cannot place word {word} on board {self}")
+        self._begin()
+        super().place_word(word, validate=False)
+
+    def undo(self) -> None:
+        if not self._journal:
+            raise self.UndoError("Nothing to undo")
+        changes, words = self._journal.pop()
+        for position, tile in reversed(changes):
+            super()._put(position, tile)
+        self._words = words
@@ -0,0 +1,98 @@
+import pytest
+
+from banana.board import ACROSS, DOWN, Board, Position, Tile, Word, WorkingBoard
+
+
+def test_freeze() -> None:
+    board = WorkingBoard([Tile("A", Position(0, 0))])
+    frozen = board.freeze()
+    assert type(frozen) is Board
+    assert frozen == Board([Tile("A", Position(0, 0))])
+    board.add_tile(Tile("B", Position(1, 0)))
+    assert frozen == Board([Tile("A", Position(0, 0))])
+
+
+def test_copy() -> None:
+    board = WorkingBoard([Tile("A", Position(0, 0))])
+    board.add_tile(Tile("B", Position(1, 0)))
+    copy = board.copy()
+    assert isinstance(copy, WorkingBoard)
+    assert copy == board
+    assert copy.depth == 0
+    with pytest.raises(WorkingBoard.UndoError):
+        copy.undo()
+
+
+def test_place_word_and_undo() -> None:
+    board = WorkingBoard(Board.from_str("ABC"))
+    words = board.get_words()
+    board.place_word(Word.from_str("BDE", Position(1, 0), DOWN))
+    assert board.depth == 1
+    assert board == Board.from_str(
+        """
+        ABC
+         D
+         E
+        """
+    )
+    assert {word.value for word in board.get_words()} == {"ABC", "BDE"}
+    board.undo()
+    assert board.depth == 0
+    assert board == Board.from_str("ABC")
+    assert board.get_words() is words
+
+
+def test_place_invalid_word() -> None:
+    board = WorkingBoard(Board.from_str("ABC"))
+    with pytest.raises(WorkingBoard.ValueError):
+        board.place_word(Word.from_str("DE", Position(0, 0), ACROSS))
+    assert board.depth == 0
+
+
+def test_undo_overwrite() -> None:
+    board = WorkingBoard(Board.from_str("AB"))
+    board.place_word(Word.from_str("CD", Position(0, 0), ACROSS), validate=False)
+    assert board == Board.from_str("CD")
+    board.undo()
+    assert board == Board.from_str("AB")
+
+
+def test_undo_add_and_remove_tile() -> None:
+    board = WorkingBoard([Tile("A", Position(0, 0))])
+    board.add_tile(Tile("B", Position(1, 0)))
+    board.remove_tile_at(Position(0, 0))
+    assert set(board) == {Tile("B", Position(1, 0))}
+    board.undo()
+    assert set(board) == {Tile("A", Position(0, 0)), Tile("B", Position(1, 0))}
+    board.undo()
+    assert set(board) == {Tile("A", Position(0, 0))}
+
+
+def test_nested_undo() -> None:
+    board = WorkingBoard(Board.from_str("AB"))
+    board.place_word(Word.from_str("AC", Position(0, 0), DOWN))
+    board.place_word(Word.from_str("BD", Position(1, 0), DOWN))
+    assert board == Board.from_str(
+        """
+        AB
+        CD
+        """
+    )
+    board.undo()
+    assert board == Board.from_str(
+        """
+        AB
+        C
+        """
+    )
+    board.undo()
+    assert board == Board.from_str("AB")
+
+
+def test_undo_restores_anchors() -> None:
+    board = WorkingBoard(Board.from_str("ABC"))
+    anchors = set(board.anchors())
+    board.place_word(Word.from_str("BD", Position(1, 0), DOWN))
+    assert set(board.anchors()) != anchors
+    board.undo()
+    assert set(board.anchors()) == anchors
@@ -1,3 +1,9 @@
 from .constraint import Constraint as Constraint
 from .constraint_generator import ConstraintGenerator as ConstraintGenerator
+from .cross_checks import CrossChecks as CrossChecks
+from .gaddag import Gaddag as Gaddag
+from .lexicon import Lexicon as Lexicon
+from .lru_cache import LRUCache as LRUCache
 from .search import Search as Search
+from .transposition_table import TranspositionTable as TranspositionTable
+from .trie import Trie as Trie
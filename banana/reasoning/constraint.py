@@ -1,11 +1,42 @@
 from typing import Iterable
 
-from banana.board import Board, Word
+from banana.board import Board, Placement, Word
+from banana.reasoning.lexicon import Lexicon
 
 
 class Constraint:
+    # Estimates And uses to plan its stages: cost is relative to a filter()
+    # over strings, selectivity the fraction of words filter() keeps.
+    @property
+    def cost(self) -> float:
+        return 1.0
+
+    @property
+    def selectivity(self) -> float:
+        return 1.0
+
+    @property
+    def reorders(self) -> bool:
+        return False
+
     def filter(self, words: Iterable[str]) -> Iterable[str]:
         return words
 
+    def filter_mask(self, lexicon: Lexicon, mask: int) -> int:
+        # filter() over a set of lexicon word ids; override with bitset
+        # operations where a constraint can.
+        return lexicon.mask(self.filter(lexicon.select(mask)))
+
+    def order(self, words: list[str]) -> Iterable[str]:
+        # For constraints that reorder words, which a mask can't express.
+        return words
+
+    def select(self, lexicon: Lexicon) -> Iterable[str]:
+        # The words filter() would pass, found as a mask and materialized once.
+        return self.order(lexicon.select(self.filter_mask(lexicon, lexicon.all)))
+
     def create_candidates(self, board: Board, word: str) -> Iterable[Word]:
         return []
+
+    def create_placements(self, board: Board, word: str) -> Iterable[Placement]:
+        return map(Placement.from_word, self.create_candidates(board, word))
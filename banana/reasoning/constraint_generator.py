@@ -5,6 +5,7 @@ from typing import Iterable
 from banana.board import Board
 from banana.reasoning.constraint import Constraint
 from banana.reasoning.constraints import InSet
+from banana.reasoning.lexicon import Lexicon
 
 
 class ConstraintGenerator(ABC):
@@ -13,11 +14,18 @@ class ConstraintGenerator(ABC):
         self, board: Board, letters: Iterable[str]
     ) -> Iterable[Constraint]: ...
 
+    def count(self, board: Board, letters: Iterable[str]) -> int:
+        # How many constraints generate() would yield; override where that's
+        # known without generating them.
+        return sum(1 for _ in self.generate(board, letters))
+
     @staticmethod
     def filter_can_build(
         words: Iterable[str],
         letters: Iterable[str],
     ) -> Constraint:
+        if isinstance(words, Lexicon):
+            return InSet.from_mask(words, words.can_build(letters))
         letter_counts = Counter(letters)
         return InSet(
             filter(
@@ -1,4 +1,4 @@
-from banana.reasoning import ConstraintGenerator
+from banana.reasoning import ConstraintGenerator, Lexicon
 
 
 def test_filter_can_build() -> None:
@@ -7,3 +7,11 @@ def test_filter_can_build() -> None:
         "ABC",
     )
     assert list(c.filter(["AB", "BC", "AD"])) == ["AB", "BC"]
+
+
+def test_filter_can_build_lexicon() -> None:
+    c = ConstraintGenerator.filter_can_build(
+        Lexicon(["AB", "BC", "AD"]),
+        "ABC",
+    )
+    assert sorted(c.filter(["AB", "BC", "AD"])) == ["AB", "BC"]
@@ -1,5 +1,7 @@
+from typing import Iterable, override
+
 from banana.board import Board
-from banana.reasoning import Constraint
+from banana.reasoning import Constraint, Lexicon
 
 
 def test_filter() -> None:
@@ -8,3 +10,37 @@ def test_filter() -> None:
 
 def test_create_candidates() -> None:
     assert list(Constraint().create_candidates(Board([]), "abc")) == []
+
+
+def test_create_placements() -> None:
+    assert list(Constraint().create_placements(Board([]), "abc")) == []
+
+
+def test_filter_mask() -> None:
+    class StartsWithA(Constraint):
+        @override
+        def filter(self, words: Iterable[str]) -> Iterable[str]:
+            return (word for word in words if word.startswith("A"))
+
+    lexicon = Lexicon(["AB", "BA", "AC"])
+    assert Constraint().filter_mask(lexicon, 0b101) == 0b101
+    assert lexicon.select(StartsWithA().filter_mask(lexicon, lexicon.all)) == [
+        "AB",
+        "AC",
+    ]
+
+
+def test_select() -> None:
+    class Reversed(Constraint):
+        @override
+        def order(self, words: list[str]) -> Iterable[str]:
+            return reversed(words)
+
+    lexicon = Lexicon(["AB", "BA", "AC"])
+    assert list(Constraint().select(lexicon)) == ["AB", "AC", "BA"]
+    assert list(Reversed().select(lexicon)) == ["BA", "AC", "AB"]
+
+
+def test_estimates() -> None:
+    c = Constraint()
+    assert (c.cost, c.selectivity, c.reorders) == (1.0, 1.0, False)
@@ -1,5 +1,6 @@
 from .and_ import And as And
 from .contains import Contains as Contains
+from .fits_at_anchor import FitsAtAnchor as FitsAtAnchor
 from .in_set import InSet as InSet
 from .sort_words_by_len import SortWordsByLen as SortWordsByLen
 from .start import Start as Start
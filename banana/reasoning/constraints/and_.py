@@ -1,8 +1,11 @@
+from functools import cached_property
 from itertools import chain
+from math import inf, prod
 from typing import Iterable, Iterator, Sized, override
 
-from banana.board import Board, Word
+from banana.board import Board, Placement, Word
 from banana.reasoning.constraint import Constraint
+from banana.reasoning.lexicon import Lexicon
 
 
 class And(Constraint, Sized, Iterable[Constraint]):
@@ -21,14 +24,61 @@ class And(Constraint, Sized, Iterable[Constraint]):
     def __iter__(self) -> Iterator[Constraint]:
         return iter(self._constraints)
 
+    @staticmethod
+    def _rank(constraint: Constraint) -> tuple[bool, float]:
+        # Reordering stages go last, so they only sort the survivors; filters
+        # go cheapest per word removed first.
+        if constraint.selectivity >= 1:
+            return constraint.reorders, inf
+        return constraint.reorders, constraint.cost / (1 - constraint.selectivity)
+
+    @cached_property
+    def plan(self) -> tuple[Constraint, ...]:
+        # The order filter(), filter_mask() and order() apply the constraints
+        # in; stable, so ties keep construction order.
+        return tuple(sorted(self._constraints, key=And._rank))
+
+    @property
+    @override
+    def cost(self) -> float:
+        return sum(constraint.cost for constraint in self)
+
+    @property
+    @override
+    def selectivity(self) -> float:
+        return prod(constraint.selectivity for constraint in self)
+
+    @property
+    @override
+    def reorders(self) -> bool:
+        return any(constraint.reorders for constraint in self)
+
     @override
     def filter(self, words: Iterable[str]) -> Iterable[str]:
-        for constraint in self:
+        for constraint in self.plan:
             words = constraint.filter(words)
         return words
 
+    @override
+    def filter_mask(self, lexicon: Lexicon, mask: int) -> int:
+        for constraint in self.plan:
+            mask = constraint.filter_mask(lexicon, mask)
+        return mask
+
+    @override
+    def order(self, words: list[str]) -> Iterable[str]:
+        for constraint in self.plan:
+            words = list(constraint.order(words))
+        return words
+
     @override
     def create_candidates(self, board: Board, word: str) -> Iterable[Word]:
         return chain.from_iterable(
             constraint.create_candidates(board, word) for constraint in self
         )
+
+    @override
+    def create_placements(self, board: Board, word: str) -> Iterable[Placement]:
+        return chain.from_iterable(
+            constraint.create_placements(board, word) for constraint in self
+        )
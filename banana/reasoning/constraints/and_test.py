@@ -2,8 +2,10 @@ from typing import Iterable, override
 
 from pytest_subtests import SubTests
 
-from banana.board import Board, Position, Tile, Word
+from banana.board import ACROSS, Board, Placement, Position, Tile, Word
+from banana.reasoning import Lexicon
 from banana.reasoning.constraint import Constraint
+from banana.reasoning.constraints import Contains, InSet, SortWordsByLen, Start
 from banana.reasoning.constraints.and_ import And
 
 
@@ -67,3 +69,59 @@ def test_create_candidates_merges_outputs(subtests: SubTests) -> None:
 
     assert len(candidates) == 2
     assert {w.value for w in candidates} == {"APPLE"}
+
+
+def test_create_placements_merges_outputs() -> None:
+    c = And([MockCandidateConstraint("A"), MockCandidateConstraint("X")])
+    assert list(c.create_placements(Board([]), "APPLE")) == [
+        Placement("APPLE", Position(0, 0), ACROSS)
+    ]
+
+
+def test_filter_mask_intersects() -> None:
+    lexicon = Lexicon(["MA", "PA", "MAP", "AM"])
+    c = And([Contains(["A"]), InSet(["MA", "MAP", "AM"]), MockFilterConstraint("A")])
+    assert lexicon.select(c.filter_mask(lexicon, lexicon.all)) == ["MA"]
+
+
+def test_select_orders_after_filtering() -> None:
+    lexicon = Lexicon(["MAP", "MA", "PA", "AMMA"])
+    c = And([SortWordsByLen(reverse=True), Contains(["M"])])
+    assert list(c.select(lexicon)) == ["AMMA", "MAP", "MA"]
+
+
+def test_plan(subtests: SubTests) -> None:
+    lexicon = Lexicon(["MA", "PA", "MAP", "AM"])
+    sort = SortWordsByLen()
+    contains = Contains(["A"])
+    narrow = InSet.from_mask(lexicon, lexicon.mask(["MA"]))
+    mock = MockFilterConstraint("A")
+    start = Start()
+    reverse = SortWordsByLen(reverse=True)
+    for constraints, expected in list[tuple[list[Constraint], list[Constraint]]](
+        [
+            ([], []),
+            ([sort, contains, narrow], [narrow, contains, sort]),
+            ([mock, start, contains], [contains, mock, start]),
+            ([sort, reverse], [sort, reverse]),
+        ]
+    ):
+        with subtests.test(constraints=constraints):
+            c = And(constraints)
+            assert list(c.plan) == expected
+            assert c.plan is c.plan
+
+
+def test_estimates() -> None:
+    lexicon = Lexicon(["MA", "PA", "MAP", "AM"])
+    narrow = InSet.from_mask(lexicon, lexicon.mask(["MA"]))
+    c = And([narrow, Contains(["A", "M"])])
+    assert c.cost == narrow.cost + Contains(["A"]).cost
+    assert c.selectivity == 0.25 * 0.25
+    assert not c.reorders
+    assert And([c, SortWordsByLen()]).reorders
+
+
+def test_filter_sorts_survivors_last() -> None:
+    c = And([SortWordsByLen(reverse=True), MockFilterConstraint("A")])
+    assert list(c.filter(["MA", "PAPA", "MAP"])) == ["PAPA", "MA"]
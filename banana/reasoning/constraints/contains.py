@@ -1,6 +1,7 @@
 from typing import Iterable, override
 
 from banana.reasoning.constraint import Constraint
+from banana.reasoning.lexicon import Lexicon
 
 
 class Contains(Constraint):
@@ -17,9 +18,23 @@ class Contains(Constraint):
     def __repr__(self) -> str:
         return f"Contains({self._letters})"
 
+    @property
+    @override
+    def cost(self) -> float:
+        return 0.01
+
+    @property
+    @override
+    def selectivity(self) -> float:
+        return 0.5 ** len(self._letters)
+
     @override
     def filter(self, words: Iterable[str]) -> Iterable[str]:
         return filter(
             lambda word: all(letter in word for letter in self._letters),
             words,
         )
+
+    @override
+    def filter_mask(self, lexicon: Lexicon, mask: int) -> int:
+        return mask & lexicon.containing(self._letters)
@@ -1,5 +1,6 @@
 import pytest
 
+from banana.reasoning import Lexicon
 from banana.reasoning.constraints import Contains
 
 
@@ -11,3 +12,16 @@ def test_invalid_letters() -> None:
 def test_filter() -> None:
     assert list(Contains(["A"]).filter(["ABC", "DEF"])) == ["ABC"]
     assert list(Contains(["A", "B"]).filter(["ABC", "ADEF", "BDEF", "DEF"])) == ["ABC"]
+
+
+def test_filter_mask() -> None:
+    lexicon = Lexicon(["ABC", "ADEF", "BDEF", "DEF"])
+    c = Contains(["A", "B"])
+    assert lexicon.select(c.filter_mask(lexicon, lexicon.all)) == ["ABC"]
+    assert c.filter_mask(lexicon, lexicon.mask(["ADEF"])) == 0
+
+
+def test_estimates() -> None:
+    assert Contains(["A"]).selectivity > Contains(["A", "B"]).selectivity
+    assert Contains(["A"]).cost < 1
+    assert not Contains(["A"]).reorders
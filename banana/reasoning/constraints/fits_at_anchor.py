@@ -0,0 +1,79 @@
+from typing import Iterable, Optional, override
+
+from banana.board import Board, Direction, Placement, Position, Word
+from banana.reasoning.constraint import Constraint
+from banana.reasoning.lexicon import Lexicon
+
+
+class FitsAtAnchor(Constraint):
+    # Words through the anchor tile at position that line up on its letter
+    # and fit within before squares ahead of it and after past it along
+    # direction (None for no limit).
+
+    class Error(Exception): ...
+
+    class ValueError(Error, ValueError): ...
+
+    def __init__(
+        self,
+        position: Position,
+        direction: Direction,
+        letter: str,
+        before: Optional[int] = None,
+        after: Optional[int] = None,
+    ) -> None:
+        if len(letter) != 1:
+            raise self.ValueError(f"Anchor letter must be one letter: {letter!r}")
+        if (before is not None and before < 0) or (after is not None and after < 0):
+            raise self.ValueError(f"Invalid span: {before}, {after}")
+        self.position = position
+        self.direction = direction
+        self.letter = letter
+        self.before = before
+        self.after = after
+
+    @override
+    def __repr__(self) -> str:
+        return (
+            f"FitsAtAnchor({self.position}, {self.direction}, {self.letter!r}, "
+            f"before={self.before}, after={self.after})"
+        )
+
+    @property
+    @override
+    def cost(self) -> float:
+        return 0.01
+
+    @property
+    @override
+    def selectivity(self) -> float:
+        return 0.1
+
+    def offsets(self, word: str) -> list[int]:
+        # Where the anchor can sit in word.
+        first = 0 if self.after is None else max(len(word) - 1 - self.after, 0)
+        last = len(word) - 1 if self.before is None else min(self.before, len(word) - 1)
+        return [
+            offset for offset in range(first, last + 1) if word[offset] == self.letter
+        ]
+
+    @override
+    def filter(self, words: Iterable[str]) -> Iterable[str]:
+        return filter(self.offsets, words)
+
+    @override
+    def filter_mask(self, lexicon: Lexicon, mask: int) -> int:
+        return mask & lexicon.fitting(self.letter, self.before, self.after)
+
+    @override
+    def create_candidates(self, board: Board, word: str) -> Iterable[Word]:
+        return map(Placement.to_word, self.create_placements(board, word))
+
+    @override
+    def create_placements(self, board: Board, word: str) -> Iterable[Placement]:
+        # Only the anchor is checked; any other tiles in the span are left to
+        # subclasses or to the search.
+        return [
+            Placement(word, self.position - self.direction * offset, self.direction)
+            for offset in self.offsets(word)
+        ]
@@ -0,0 +1,70 @@
+from typing import Optional
+
+import pytest
+from pytest_subtests import SubTests
+
+from banana.board import ACROSS, DOWN, Board, Placement, Position, Word
+from banana.reasoning import Lexicon
+from banana.reasoning.constraints import FitsAtAnchor
+
+
+def test_invalid(subtests: SubTests) -> None:
+    for letter, before, after in list[tuple[str, Optional[int], Optional[int]]](
+        [
+            ("", None, None),
+            ("AB", None, None),
+            ("A", -1, None),
+            ("A", None, -1),
+        ]
+    ):
+        with subtests.test(letter=letter, before=before, after=after):
+            with pytest.raises(FitsAtAnchor.ValueError):
+                FitsAtAnchor(Position(0, 0), ACROSS, letter, before, after)
+
+
+def test_offsets(subtests: SubTests) -> None:
+    for before, after, word, expected in list[
+        tuple[Optional[int], Optional[int], str, list[int]]
+    ](
+        [
+            (None, None, "ABA", [0, 2]),
+            (0, None, "ABA", [0]),
+            (None, 0, "ABA", [2]),
+            (1, 1, "ABA", []),
+            (2, 2, "BAB", [1]),
+            (0, 0, "A", [0]),
+            (None, None, "BCD", []),
+        ]
+    ):
+        with subtests.test(before=before, after=after, word=word):
+            c = FitsAtAnchor(Position(0, 0), ACROSS, "A", before, after)
+            assert c.offsets(word) == expected
+
+
+def test_filter() -> None:
+    c = FitsAtAnchor(Position(0, 0), ACROSS, "A", 1, 1)
+    assert list(c.filter(["ABA", "BA", "AB", "BBA", "C"])) == ["BA", "AB"]
+
+
+def test_filter_mask() -> None:
+    lexicon = Lexicon(["ABA", "BA", "AB", "BBA", "C"])
+    c = FitsAtAnchor(Position(0, 0), ACROSS, "A", 1, 1)
+    assert lexicon.select(c.filter_mask(lexicon, lexicon.all)) == ["AB", "BA"]
+    assert lexicon.select(c.filter_mask(lexicon, lexicon.mask(["BA"]))) == ["BA"]
+
+
+def test_create_placements() -> None:
+    board = Board.from_str("A")
+    c = FitsAtAnchor(Position(0, 0), DOWN, "A", 1, None)
+    assert list(c.create_placements(board, "ABA")) == [
+        Placement("ABA", Position(0, 0), DOWN)
+    ]
+    assert list(c.create_candidates(board, "BAB")) == [
+        Word.from_str("BAB", Position(0, -1), DOWN)
+    ]
+
+
+def test_estimates() -> None:
+    c = FitsAtAnchor(Position(0, 0), ACROSS, "A")
+    assert c.cost < 1
+    assert c.selectivity < 1
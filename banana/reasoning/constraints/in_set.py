@@ -1,20 +1,57 @@
-from typing import Iterable, override
+from typing import Iterable, Optional, override
 
 from banana.reasoning.constraint import Constraint
+from banana.reasoning.lexicon import Lexicon
 
 
 class InSet(Constraint):
     def __init__(self, words: Iterable[str]) -> None:
-        self._words = frozenset(words)
+        self._words: Optional[frozenset[str]] = frozenset(words)
+        # The same set as a mask over _lexicon, once known.
+        self._lexicon: Optional[Lexicon] = None
+        self._mask = 0
+
+    @staticmethod
+    def from_mask(lexicon: Lexicon, mask: int) -> "InSet":
+        in_set = InSet([])
+        in_set._words = None
+        in_set._lexicon = lexicon
+        in_set._mask = mask
+        return in_set
 
     @override
     def __repr__(self) -> str:
-        return f"InSet({self._words})"
+        return f"InSet({self.words})"
+
+    @property
+    def words(self) -> frozenset[str]:
+        if self._words is None:
+            assert self._lexicon is not None
+            self._words = frozenset(self._lexicon.select(self._mask))
+        return self._words
+
+    @property
+    @override
+    def cost(self) -> float:
+        return 0.01
+
+    @property
+    @override
+    def selectivity(self) -> float:
+        if self._lexicon is None or len(self._lexicon) == 0:
+            # Most sets are a small slice of the lexicon they're used with.
+            return 0.1
+        return self._mask.bit_count() / len(self._lexicon)
 
     @override
     def filter(self, words: Iterable[str]) -> Iterable[str]:
-        return self._words
-        # return filter(
-        #     self._words.__contains__,
-        #     words,
-        # )
+        return filter(self.words.__contains__, words)
+
+    @override
+    def filter_mask(self, lexicon: Lexicon, mask: int) -> int:
+        if self._lexicon is None:
+            self._lexicon = lexicon
+            self._mask = lexicon.mask(self.words)
+        if lexicon.same_words(self._lexicon):
+            return mask & self._mask
+        return mask & lexicon.mask(self.words)
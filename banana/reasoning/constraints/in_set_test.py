@@ -1,5 +1,51 @@
+from pytest_subtests import SubTests
+
+from banana.reasoning import Lexicon
 from banana.reasoning.constraints import InSet
 
 
 def test_filter() -> None:
     assert list(InSet(["ABC"]).filter(["ABC", "DEF"])) == ["ABC"]
+
+
+def test_filter_mask() -> None:
+    lexicon = Lexicon(["ABC", "DEF", "GHI"])
+    c = InSet(["ABC", "GHI", "XYZ"])
+    assert lexicon.select(c.filter_mask(lexicon, lexicon.all)) == ["ABC", "GHI"]
+    assert lexicon.select(c.filter_mask(lexicon, lexicon.mask(["GHI"]))) == ["GHI"]
+
+
+def test_filter_keeps_input_order() -> None:
+    assert list(InSet(["A", "B", "C"]).filter(["C", "X", "A"])) == ["C", "A"]
+
+
+def test_from_mask() -> None:
+    lexicon = Lexicon(["ABC", "DEF", "GHI"])
+    c = InSet.from_mask(lexicon, lexicon.mask(["ABC", "GHI"]))
+    assert c.filter_mask(lexicon, lexicon.mask(["DEF", "GHI"])) == lexicon.mask(["GHI"])
+    assert c.words == frozenset(["ABC", "GHI"])
+    assert list(c.filter(["GHI", "DEF"])) == ["GHI"]
+
+
+def test_filter_mask_other_lexicon() -> None:
+    lexicon = Lexicon(["ABC", "DEF", "GHI"])
+    c = InSet.from_mask(lexicon, lexicon.mask(["ABC", "GHI"]))
+    same = Lexicon(["GHI", "DEF", "ABC"])
+    assert c.filter_mask(same, same.all) == same.mask(["ABC", "GHI"])
+    other = Lexicon(["ABC", "GHI", "JKL"])
+    assert c.filter_mask(other, other.all) == other.mask(["ABC", "GHI"])
+
+
+def test_selectivity(subtests: SubTests) -> None:
+    lexicon = Lexicon(["ABC", "DEF", "GHI", "JKL"])
+    for c, expected in list[tuple[InSet, float]](
+        [
+            (InSet(["ABC"]), 0.1),
+            (InSet.from_mask(lexicon, lexicon.mask(["ABC"])), 0.25),
+            (InSet.from_mask(lexicon, lexicon.all), 1.0),
+            (InSet.from_mask(Lexicon([]), 0), 0.1),
+        ]
+    ):
+        with subtests.test(c=c):
+            assert c.selectivity == expected
+            assert c.cost < 1
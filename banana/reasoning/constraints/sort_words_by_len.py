@@ -1,6 +1,7 @@
 from typing import Iterable, override
 
 from banana.reasoning.constraint import Constraint
+from banana.reasoning.lexicon import Lexicon
 
 
 class SortWordsByLen(Constraint):
@@ -11,6 +12,25 @@ class SortWordsByLen(Constraint):
     def __repr__(self) -> str:
         return f"SortWordsByLen(reverse={self.reverse})"
 
+    @property
+    @override
+    def cost(self) -> float:
+        return 0.0
+
+    @property
+    @override
+    def reorders(self) -> bool:
+        return True
+
     @override
     def filter(self, words: Iterable[str]) -> Iterable[str]:
         return sorted(words, key=len, reverse=self.reverse)
+
+    @override
+    def filter_mask(self, lexicon: Lexicon, mask: int) -> int:
+        # A set of ids has no order to change; order() does the sorting.
+        return mask
+
+    @override
+    def order(self, words: list[str]) -> Iterable[str]:
+        return self.filter(words)
@@ -1,3 +1,4 @@
+from banana.reasoning import Lexicon
 from banana.reasoning.constraints import SortWordsByLen
 
 
@@ -8,3 +9,18 @@ def test_filter() -> None:
         "ab",
         "a",
     ]
+
+
+def test_filter_mask() -> None:
+    lexicon = Lexicon(["a", "ab", "abc"])
+    assert SortWordsByLen().filter_mask(lexicon, 0b110) == 0b110
+
+
+def test_select() -> None:
+    lexicon = Lexicon(["abc", "b", "ab"])
+    assert list(SortWordsByLen().select(lexicon)) == ["b", "ab", "abc"]
+
+
+def test_estimates() -> None:
+    c = SortWordsByLen()
+    assert (c.cost, c.selectivity, c.reorders) == (0.0, 1.0, True)
@@ -1,7 +1,8 @@
 from typing import Iterable, override
 
-from banana.board import ACROSS, Board, Position, Word
+from banana.board import ACROSS, Board, Placement, Position, Word
 from banana.reasoning.constraint import Constraint
+from banana.reasoning.lexicon import Lexicon
 
 
 class Start(Constraint):
@@ -9,10 +10,18 @@ class Start(Constraint):
     def __repr__(self) -> str:
         return "Start()"
 
+    @override
+    def filter_mask(self, lexicon: Lexicon, mask: int) -> int:
+        return mask
+
     @override
     def create_candidates(self, board: Board, word: str) -> Iterable[Word]:
+        return map(Placement.to_word, self.create_placements(board, word))
+
+    @override
+    def create_placements(self, board: Board, word: str) -> Iterable[Placement]:
         return [
-            Word.from_str(
+            Placement(
                 word,
                 Position(0, 0),
                 ACROSS,
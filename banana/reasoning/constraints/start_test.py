@@ -1,4 +1,5 @@
-from banana.board import ACROSS, Board, Position, Word
+from banana.board import ACROSS, Board, Placement, Position, Word
+from banana.reasoning import Lexicon
 from banana.reasoning.constraints import Start
 
 
@@ -10,3 +11,14 @@ def test_create_candidates() -> None:
             ACROSS,
         )
     ]
+
+
+def test_create_placements() -> None:
+    assert list(Start().create_placements(Board([]), "abc")) == [
+        Placement("abc", Position(0, 0), ACROSS)
+    ]
+
+
+def test_filter_mask() -> None:
+    lexicon = Lexicon(["abc", "def"])
+    assert Start().filter_mask(lexicon, 0b10) == 0b10
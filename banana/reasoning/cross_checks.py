@@ -0,0 +1,45 @@
+from itertools import chain
+from typing import Iterable, Optional, override
+
+from banana.board import Board, Direction, Placement, Position
+
+
+class CrossChecks:
+    def __init__(self, words: Iterable[str]) -> None:
+        self.words = frozenset(words)
+        self._alphabet = sorted(frozenset(chain.from_iterable(self.words)))
+        self._letters = dict[tuple[str, str], frozenset[str]]()
+
+    @override
+    def __repr__(self) -> str:
+        return f"CrossChecks(words={len(self.words)}, fragments={len(self._letters)})"
+
+    def letters(self, prefix: str, suffix: str) -> frozenset[str]:
+        if (letters := self._letters.get((prefix, suffix))) is None:
+            letters = self._letters[prefix, suffix] = frozenset(
+                letter
+                for letter in self._alphabet
+                if prefix + letter + suffix in self.words
+            )
+        return letters
+
+    def allowed(
+        self, board: Board, position: Position, direction: Direction
+    ) -> Optional[frozenset[str]]:
+        # The letters that can go on the empty square at position as part of a
+        # word running in direction, or None if nothing crosses it.
+        prefix, suffix = board.fragments(position, direction.orthogonal())
+        if not prefix and not suffix:
+            return None
+        return self.letters(prefix, suffix)
+
+    def permits(self, board: Board, placement: Placement) -> bool:
+        for letter, position in zip(
+            placement.value, placement.positions(), strict=True
+        ):
+            if board.occupied(position):
+                continue
+            allowed = self.allowed(board, position, placement.direction)
+            if allowed is not None and letter not in allowed:
+                return False
+        return True
@@ -0,0 +1,56 @@
+from typing import Optional
+
+from pytest_subtests import SubTests
+
+from banana.board import ACROSS, DOWN, Board, Placement, Position
+from banana.reasoning import CrossChecks
+
+
+def test_letters() -> None:
+    cross_checks = CrossChecks(["CAT", "COT", "CUT", "AT"])
+    assert cross_checks.letters("C", "T") == frozenset("AOU")
+    assert cross_checks.letters("", "T") == frozenset("A")
+    assert cross_checks.letters("X", "") == frozenset()
+    assert cross_checks.letters("C", "T") is cross_checks.letters("C", "T")
+
+
+def test_allowed(subtests: SubTests) -> None:
+    board = Board.from_str(
+        """
+        C
+         
+        T
+        """
+    )
+    cross_checks = CrossChecks(["CAT", "COT", "AT", "TA"])
+    for position, expected in list[tuple[Position, Optional[frozenset[str]]]](
+        [
+            (Position(0, 1), frozenset("AO")),
+            (Position(0, 3), frozenset("A")),
+            (Position(1, 1), None),
+        ]
+    ):
+        with subtests.test(position=position):
+            assert cross_checks.allowed(board, position, ACROSS) == expected
+
+
+def test_permits(subtests: SubTests) -> None:
+    board = Board.from_str(
+        """
+        C
+         
+        T
+        """
+    )
+    cross_checks = CrossChecks(["CAT", "COT", "AX", "OX", "XO"])
+    for placement, expected in list[tuple[Placement, bool]](
+        [
+            (Placement("AX", Position(0, 1), ACROSS), True),
+            (Placement("XO", Position(-1, 1), ACROSS), True),
+            (Placement("XA", Position(-1, 1), ACROSS), True),
+            (Placement("EX", Position(0, 1), ACROSS), False),
+            (Placement("CAT", Position(0, 0), DOWN), True),
+        ]
+    ):
+        with subtests.test(placement=placement):
+            assert cross_checks.permits(board, placement) == expected
@@ -0,0 +1,45 @@
+from typing import Iterable, Iterator, Optional, override
+
+from banana.reasoning.trie import Trie
+
+
+class Gaddag:
+    # Every word is stored once per split point: the letters up to and
+    # including the split reversed, then SEPARATOR, then the rest. A walk can
+    # so start at any letter of a word and grow it outwards in both
+    # directions. Terminal nodes hold the original word.
+    SEPARATOR = "+"
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self.root = Trie.Node()
+        self._words = sorted(frozenset(words))
+        self.max_length = max(map(len, self._words), default=0)
+        for word in self._words:
+            for split in range(1, len(word) + 1):
+                node = self.root
+                for letter in word[split - 1 :: -1] + self.SEPARATOR + word[split:]:
+                    node = node.children.setdefault(letter, Trie.Node())
+                node.word = word
+
+    @override
+    def __repr__(self) -> str:
+        return f"Gaddag(words={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str) or not word:
+            return False
+        node = self.find(word[::-1] + self.SEPARATOR)
+        return node is not None and node.word is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._words)
+
+    def find(self, path: str) -> Optional[Trie.Node]:
+        node = self.root
+        for letter in path:
+            if (node := node.children.get(letter)) is None:
+                return None
+        return node
@@ -0,0 +1,36 @@
+from banana.reasoning import Gaddag
+
+
+def test_len_iter() -> None:
+    gaddag = Gaddag(["CAT", "CA", "DOG", "CAT"])
+    assert len(gaddag) == 3
+    assert list(gaddag) == ["CA", "CAT", "DOG"]
+    assert gaddag.max_length == 3
+
+
+def test_contains() -> None:
+    gaddag = Gaddag(["CAT", "CA"])
+    assert "CA" in gaddag
+    assert "CAT" in gaddag
+    assert "C" not in gaddag
+    assert "AT" not in gaddag
+    assert "" not in gaddag
+    assert 1 not in gaddag
+
+
+def test_find() -> None:
+    gaddag = Gaddag(["CAT"])
+    for path in "C+AT", "AC+T", "TAC+":
+        node = gaddag.find(path)
+        assert node is not None
+        assert node.word == "CAT"
+    node = gaddag.find("A")
+    assert node is not None
+    assert set(node.children) == {"C"}
+    assert gaddag.find("T+") is None
+
+
+def test_empty() -> None:
+    gaddag = Gaddag([])
+    assert len(gaddag) == 0
+    assert gaddag.max_length == 0
@@ -1,3 +1,9 @@
+from .gaddag_constraint_generator import (
+    GaddagConstraintGenerator as GaddagConstraintGenerator,
+)
 from .simple_constraint_generator import (
     SimpleConstraintGenerator as SimpleConstraintGenerator,
 )
+from .trie_constraint_generator import (
+    TrieConstraintGenerator as TrieConstraintGenerator,
+)
@@ -0,0 +1,100 @@
+from abc import ABC, abstractmethod
+from collections import Counter
+from functools import cached_property
+from typing import Callable, Iterable, Optional, override
+
+from banana.board import Board, Direction, Placement, Position, Word
+from banana.reasoning.constraint import Constraint
+from banana.reasoning.cross_checks import CrossChecks
+from banana.reasoning.lexicon import Lexicon
+
+
+class AnchorWalk(Constraint, ABC):
+    # A constraint that finds its words by walking a lexicon along the line
+    # through an anchor tile, once and lazily, then serves filter() and
+    # create_placements() from what it found.
+
+    def __init__(
+        self,
+        board: Board,
+        position: Position,
+        direction: Direction,
+        letters: Iterable[str],
+        cross_checks: Optional[CrossChecks] = None,
+    ) -> None:
+        self.board = board
+        self.position = position
+        self.direction = direction
+        self.letters = tuple(letters)
+        self.cross_checks = cross_checks
+
+    @property
+    @abstractmethod
+    def reach(self) -> int: ...
+
+    @abstractmethod
+    def _walk(
+        self,
+        cells: list[Optional[str]],
+        hand: dict[str, int],
+        cross_check: Callable[[int], Optional[frozenset[str]]],
+        emit: Callable[[str, int], None],
+    ) -> None: ...
+
+    @cached_property
+    def _placements(self) -> dict[str, list[Placement]]:
+        board, direction = self.board, self.direction
+        # The anchor's line, indexed so the anchor is at reach; no word
+        # through the anchor can leave it.
+        reach = self.reach
+        origin = self.position - direction * reach
+        cells = [
+            tile.value if (tile := board.tile(origin + direction * i)) else None
+            for i in range(2 * reach + 2)
+        ]
+        allowed = dict[int, Optional[frozenset[str]]]()
+        placements = dict[str, list[Placement]]()
+
+        def cross_check(i: int) -> Optional[frozenset[str]]:
+            if i not in allowed:
+                allowed[i] = (
+                    self.cross_checks.allowed(board, origin + direction * i, direction)
+                    if self.cross_checks is not None
+                    else None
+                )
+            return allowed[i]
+
+        def emit(word: str, start: int) -> None:
+            placements.setdefault(word, []).append(
+                Placement(word, origin + direction * start, direction)
+            )
+
+        self._walk(cells, dict(Counter(self.letters)), cross_check, emit)
+        return placements
+
+    @property
+    @override
+    def cost(self) -> float:
+        # The walk is the expensive part, but it leaves very few words.
+        return 10.0
+
+    @property
+    @override
+    def selectivity(self) -> float:
+        return 0.001
+
+    @override
+    def filter(self, words: Iterable[str]) -> Iterable[str]:
+        return [word for word in words if word in self._placements]
+
+    @override
+    def filter_mask(self, lexicon: Lexicon, mask: int) -> int:
+        return mask & lexicon.mask(self._placements)
+
+    @override
+    def create_candidates(self, board: Board, word: str) -> Iterable[Word]:
+        return map(Placement.to_word, self.create_placements(board, word))
+
+    @override
+    def create_placements(self, board: Board, word: str) -> Iterable[Placement]:
+        return self._placements.get(word, [])
@@ -0,0 +1,206 @@
+from typing import Iterable, override
+
+import pytest
+from pytest_subtests import SubTests
+
+from banana.board import ACROSS, DOWN, Board, Position, Word
+from banana.reasoning import ConstraintGenerator, Lexicon
+from banana.reasoning.constraint import Constraint
+from banana.reasoning.constraints.and_ import And
+from banana.reasoning.generators import (
+    GaddagConstraintGenerator,
+    SimpleConstraintGenerator,
+    TrieConstraintGenerator,
+)
+from banana.reasoning.searches import DFS
+
+# The generators whose constraints walk a lexicon through each anchor.
+_GENERATORS = (TrieConstraintGenerator, GaddagConstraintGenerator)
+
+
+def _generate_candidates(
+    board: Board,
+    cg: ConstraintGenerator,
+    letters: Iterable[str],
+    words: Iterable[str],
+) -> Iterable[Word]:
+    letters = list(letters)
+    words = list(words)
+    for constraint in cg.generate(board, letters):
+        for word in constraint.filter(words):
+            yield from constraint.create_candidates(board, word)
+
+
+def test_start(subtests: SubTests) -> None:
+    for generator in _GENERATORS:
+        with subtests.test(generator=generator.__name__):
+            cg = generator(["ABC", "DEF"])
+            assert list(_generate_candidates(Board([]), cg, "ABC", ["ABC", "DEF"])) == [
+                Word.from_str("ABC", Position(0, 0), ACROSS)
+            ]
+
+
+def test_anchor(subtests: SubTests) -> None:
+    for board_str, letters, words, expected in list[
+        tuple[str, str, list[str], list[Word]]
+    ](
+        [
+            (
+                "ABC",
+                "DE",
+                ["ABC", "CDE", "CDF"],
+                [Word.from_str("CDE", Position(2, 0), DOWN)],
+            ),
+            (
+                """
+                ABC
+                  D
+                  C
+                """,
+                "EF",
+                ["ABC", "CDC", "CEF", "CEG"],
+                [Word.from_str("CEF", Position(2, 2), ACROSS)],
+            ),
+            (
+                "ABC",
+                "EF",
+                ["ABC", "EBF", "EBG"],
+                [Word.from_str("EBF", Position(1, -1), DOWN)],
+            ),
+            (
+                "ABC",
+                "EF",
+                ["ABC", "EFB", "EGB"],
+                [Word.from_str("EFB", Position(1, -2), DOWN)],
+            ),
+            (
+                """
+                AB
+                 C
+                """,
+                "DE",
+                ["AB", "BC", "AD", "AE", "DC"],
+                [
+                    Word.from_str("AD", Position(0, 0), DOWN),
+                    Word.from_str("DC", Position(0, 1), ACROSS),
+                ],
+            ),
+            (
+                "AB",
+                "C",
+                ["AB", "ACB", "ABC", "AC"],
+                [Word.from_str("AC", Position(0, 0), DOWN)],
+            ),
+        ]
+    ):
+        for generator in _GENERATORS:
+            with subtests.test(
+                generator=generator.__name__, board_str=board_str, letters=letters
+            ):
+                board = Board.from_str(board_str)
+                cg = generator(words)
+                candidates = list(_generate_candidates(board, cg, letters, words))
+                assert set(candidates) == set(expected)
+                assert len(candidates) == len(expected)
+
+
+def test_matches_simple_constraint_generator(subtests: SubTests) -> None:
+    board = Board.from_str(
+        """
+        CAT
+          O
+        DOG
+        """
+    )
+    letters = "SEAT"
+    words = ["CAT", "TOG", "DOG", "EAT", "SEAT", "TEA", "ATE", "SAT", "CATS", "TO"]
+
+    def legal_candidates(cg: ConstraintGenerator) -> set[Word]:
+        return {
+            candidate
+            for candidate in _generate_candidates(board, cg, letters, words)
+            if board.get_letters_consumed(candidate)
+            and all(word in words for word in board.words_formed_by(candidate))
+        }
+
+    expected = legal_candidates(SimpleConstraintGenerator(words))
+    assert expected
+    for generator in _GENERATORS:
+        with subtests.test(generator=generator.__name__):
+            assert legal_candidates(generator(words)) == expected
+
+
+def test_dfs(subtests: SubTests) -> None:
+    words = ["ABC", "CDE", "EFG"]
+    for generator in _GENERATORS:
+        with subtests.test(generator=generator.__name__):
+            search = DFS(words, generator(words))
+            board = search.search(Board([]), "ABCDEFG")
+            assert {word.value for word in board.get_words()} == {"ABC", "CDE", "EFG"}
+
+
+def test_count(subtests: SubTests, monkeypatch: pytest.MonkeyPatch) -> None:
+    words = ["ABC", "CDE"]
+    for generator in _GENERATORS:
+        for board in Board([]), Board.from_str("ABC"):
+            with subtests.test(generator=generator.__name__, board=str(board)):
+                cg = generator(words)
+                expected = len(list(cg.generate(board, "DE")))
+
+                def generate(board: Board, letters: Iterable[str]) -> None:
+                    raise AssertionError("count() generated constraints")
+
+                monkeypatch.setattr(cg, "generate", generate)
+                assert cg.count(board, "DE") == expected
+
+
+def test_anchor_estimates(subtests: SubTests) -> None:
+    for generator in _GENERATORS:
+        with subtests.test(generator=generator.__name__):
+            cg = generator(["ABC", "CDE"])
+            anchor = next(iter(cg.generate(Board.from_str("ABC"), "DE")))
+            assert (
+                anchor.cost > ConstraintGenerator.filter_can_build(["ABC"], "ABC").cost
+            )
+            assert anchor.selectivity < 0.01
+
+
+class MaxLen(Constraint):
+    def __init__(self, length: int) -> None:
+        self.length = length
+
+    @override
+    def __repr__(self) -> str:
+        return f"MaxLen({self.length})"
+
+    @property
+    @override
+    def cost(self) -> float:
+        return 0.0
+
+    @property
+    @override
+    def selectivity(self) -> float:
+        return 0.5
+
+    @override
+    def filter(self, words: Iterable[str]) -> Iterable[str]:
+        return (word for word in words if len(word) <= self.length)
+
+    @override
+    def filter_mask(self, lexicon: Lexicon, mask: int) -> int:
+        return mask & lexicon.of_length(1, self.length)
+
+
+def test_filter_matches_select(subtests: SubTests) -> None:
+    words = ["ABC", "CD", "CDE", "CDEF", "XY"]
+    for generator in _GENERATORS:
+        with subtests.test(generator=generator.__name__):
+            *_, walk = generator(words).generate(Board.from_str("ABC"), "DEF")
+            constraint = And([walk, MaxLen(3)])
+            # The length check is planned first, so the walk filters its
+            # survivors.
+            assert isinstance(constraint.plan[0], MaxLen)
+            selected = list(constraint.select(Lexicon(words)))
+            assert sorted(constraint.filter(words)) == sorted(selected)
+            assert set(selected) == {"CD", "CDE"}
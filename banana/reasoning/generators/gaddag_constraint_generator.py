@@ -0,0 +1,117 @@
+from typing import Callable, Iterable, Iterator, Optional, override
+
+from banana.board import Board, Direction, Position
+from banana.reasoning.constraint import Constraint
+from banana.reasoning.constraint_generator import ConstraintGenerator
+from banana.reasoning.constraints import And, Start
+from banana.reasoning.cross_checks import CrossChecks
+from banana.reasoning.gaddag import Gaddag
+from banana.reasoning.generators.anchor_walk import AnchorWalk
+from banana.reasoning.trie import Trie
+
+
+class _GaddagAnchor(AnchorWalk):
+    def __init__(
+        self,
+        gaddag: Gaddag,
+        board: Board,
+        position: Position,
+        direction: Direction,
+        letters: Iterable[str],
+        cross_checks: Optional[CrossChecks] = None,
+    ) -> None:
+        super().__init__(board, position, direction, letters, cross_checks)
+        self.gaddag = gaddag
+
+    @override
+    def __repr__(self) -> str:
+        return f"GaddagAnchor({self.position}, {self.direction})"
+
+    @property
+    @override
+    def reach(self) -> int:
+        return self.gaddag.max_length + 1
+
+    @override
+    def _walk(
+        self,
+        cells: list[Optional[str]],
+        hand: dict[str, int],
+        cross_check: Callable[[int], Optional[frozenset[str]]],
+        emit: Callable[[str, int], None],
+    ) -> None:
+        anchor = self.reach
+
+        def fill(node: Trie.Node, i: int) -> Iterator[tuple[Trie.Node, int]]:
+            # The children of node for each letter cell i can take, with the
+            # number of hand letters used; the hand is spent while yielded.
+            if (letter := cells[i]) is not None:
+                if (child := node.children.get(letter)) is not None:
+                    yield child, 0
+                return
+            allowed = cross_check(i)
+            for letter, count in hand.items():
+                if not count or (child := node.children.get(letter)) is None:
+                    continue
+                if allowed is not None and letter not in allowed:
+                    continue
+                hand[letter] = count - 1
+                yield child, 1
+                hand[letter] = count
+
+        def left(node: Trie.Node, i: int, used: int) -> None:
+            # Cells i to the anchor are filled, read backwards into node.
+            for child, spent in fill(node, i - 1):
+                left(child, i - 1, used + spent)
+            if cells[i - 1] is not None:
+                return
+            if (turn := node.children.get(Gaddag.SEPARATOR)) is not None:
+                if turn.word is not None and cells[anchor + 1] is None and used:
+                    emit(turn.word, i)
+                right(turn, i, anchor, used)
+
+        def right(node: Trie.Node, start: int, j: int, used: int) -> None:
+            # Cells start to j are filled.
+            for child, spent in fill(node, j + 1):
+                if child.word is not None and cells[j + 2] is None and used + spent:
+                    emit(child.word, start)
+                right(child, start, j + 1, used + spent)
+
+        for child, spent in fill(self.gaddag.root, anchor):
+            left(child, anchor, spent)
+
+
+class GaddagConstraintGenerator(ConstraintGenerator):
+    def __init__(self, words: Iterable[str]) -> None:
+        self.words = frozenset(words)
+        self.gaddag = Gaddag(self.words)
+        self.cross_checks = CrossChecks(self.words)
+
+    @override
+    def __repr__(self) -> str:
+        return f"GaddagConstraintGenerator({self.gaddag})"
+
+    @override
+    def count(self, board: Board, letters: Iterable[str]) -> int:
+        return len(board.anchors()) if len(board) else 1
+
+    @override
+    def generate(self, board: Board, letters: Iterable[str]) -> Iterable[Constraint]:
+        letters = tuple(letters)
+        if len(board) == 0:
+            yield And(
+                [
+                    ConstraintGenerator.filter_can_build(self.words, letters),
+                    Start(),
+                ]
+            )
+        else:
+            for tile, direction in board.anchors():
+                yield _GaddagAnchor(
+                    self.gaddag,
+                    board,
+                    tile.position,
+                    direction,
+                    letters,
+                    self.cross_checks,
+                )
@@ -0,0 +1,67 @@
+from typing import Iterable
+
+from pytest_subtests import SubTests
+
+from banana.board import Board, Word
+from banana.reasoning import ConstraintGenerator
+from banana.reasoning.generators import (
+    GaddagConstraintGenerator,
+    TrieConstraintGenerator,
+)
+
+
+def _generate_candidates(
+    board: Board,
+    cg: ConstraintGenerator,
+    letters: Iterable[str],
+    words: Iterable[str],
+) -> Iterable[Word]:
+    letters = list(letters)
+    words = list(words)
+    for constraint in cg.generate(board, letters):
+        for word in constraint.filter(words):
+            yield from constraint.create_candidates(board, word)
+
+
+def test_matches_trie_constraint_generator(subtests: SubTests) -> None:
+    board = Board.from_str(
+        """
+        CAT  S
+          OATS
+        DOG  E
+        """
+    )
+    words = [
+        "CAT",
+        "TOG",
+        "DOG",
+        "OATS",
+        "SSE",
+        "EAT",
+        "SEAT",
+        "TEA",
+        "ATE",
+        "SAT",
+        "CATS",
+        "TO",
+        "AT",
+        "TOAD",
+        "GOAT",
+        "DOGS",
+        "ETA",
+        "SEA",
+    ]
+    for letters in "SEAT", "DOGE", "A", "TTTOOA":
+        with subtests.test(letters=letters):
+            trie = list(
+                _generate_candidates(
+                    board, TrieConstraintGenerator(words), letters, words
+                )
+            )
+            gaddag = list(
+                _generate_candidates(
+                    board, GaddagConstraintGenerator(words), letters, words
+                )
+            )
+            assert set(gaddag) == set(trie)
+            assert len(gaddag) == len(trie)
@@ -1,76 +1,129 @@
-from functools import cache
-from typing import Iterable, override
+from collections import Counter
+from typing import Iterable, Optional, override
 
-from banana.board import Board, Direction, Position, Word
+from banana.board import Board, Direction, Placement, Position
 from banana.reasoning.constraint import Constraint
 from banana.reasoning.constraint_generator import ConstraintGenerator
-from banana.reasoning.constraints import And, Contains, Start
+from banana.reasoning.constraints import And, FitsAtAnchor, Start
+from banana.reasoning.cross_checks import CrossChecks
+from banana.reasoning.lexicon import Lexicon
 
 
-class _Anchor(Constraint):
-    def __init__(self, position: Position, direction: Direction) -> None:
-        self.position = position
-        self.direction = direction
+class _Anchor(FitsAtAnchor):
+    def __init__(
+        self,
+        position: Position,
+        direction: Direction,
+        letter: str,
+        before: int,
+        after: int,
+        cross_checks: CrossChecks,
+        in_line: Optional[dict[int, str]] = None,
+        letters: Optional[Counter[str]] = None,
+    ) -> None:
+        super().__init__(position, direction, letter, before, after)
+        self.cross_checks = cross_checks
+        # Letters of the other tiles in the span by their offset from the
+        # anchor, and the hand, which words that run into them are checked
+        # against.
+        self.in_line = in_line or {}
+        self.letters = letters or Counter[str]()
 
     @override
     def __repr__(self) -> str:
         return f"Anchor({self.position}, {self.direction})"
 
+    def _fits_line(self, word: str, offset: int) -> bool:
+        # Word covers tiles in line only where they match its letters, doesn't
+        # stop next to one, which would extend it, and leaves the hand enough
+        # letters for the squares it fills.
+        covered = list[str]()
+        for line_offset, letter in self.in_line.items():
+            index = offset + line_offset
+            if index == -1 or index == len(word):
+                return False
+            if 0 <= index < len(word):
+                if word[index] != letter:
+                    return False
+                covered.append(letter)
+        if len(covered) == len(self.in_line):
+            # The lexicon filter already counted every tile in line.
+            return True
+        needed = Counter(word)
+        needed[self.letter] -= 1
+        needed.subtract(covered)
+        return needed <= self.letters
+
     @override
-    def create_candidates(self, board: Board, word: str) -> Iterable[Word]:
-        for i in range(len(word)):
-            word_ = Word.from_str(
-                word, self.position - self.direction * i, self.direction
+    def create_placements(self, board: Board, word: str) -> Iterable[Placement]:
+        placements = list[Placement]()
+        for offset in self.offsets(word):
+            if self.in_line and not self._fits_line(word, offset):
+                continue
+            placement = Placement(
+                word, self.position - self.direction * offset, self.direction
             )
-            if board.can_place_word(word_):
-                yield word_
+            if self.cross_checks.permits(board, placement):
+                placements.append(placement)
+        return placements
 
 
 class SimpleConstraintGenerator(ConstraintGenerator):
     def __init__(self, words: Iterable[str]) -> None:
-        self.words = frozenset(words)
+        # Pass a Lexicon to share its can_build cache with other generators.
+        self.lexicon = words if isinstance(words, Lexicon) else Lexicon(words)
+        self.words = frozenset(self.lexicon)
+        self.cross_checks = CrossChecks(self.words)
 
     @override
     def __repr__(self) -> str:
         return f"SimpleConstraintGenerator({self.words})"
 
-    @cache
-    @staticmethod
-    def _filter_can_build(
-        words: frozenset[str],
-        letters: tuple[str, ...],
-    ) -> Constraint:
-        return ConstraintGenerator.filter_can_build(words, letters)
+    def _filter_can_build(self, letters: tuple[str, ...]) -> Constraint:
+        return ConstraintGenerator.filter_can_build(self.lexicon, letters)
+
+    @override
+    def count(self, board: Board, letters: Iterable[str]) -> int:
+        return len(board.anchors()) if len(board) else 1
 
     @override
     def generate(self, board: Board, letters: Iterable[str]) -> Iterable[Constraint]:
         letters = tuple(letters)
-        can_build_filter = SimpleConstraintGenerator._filter_can_build(
-            self.words,
-            letters,
-        )
         if len(board) == 0:
             yield And(
                 [
-                    can_build_filter,
+                    self._filter_can_build(letters),
                     Start(),
                 ]
             )
         else:
-            for word in board.get_words():
-                direction = word.direction.orthogonal()
-                for tile in word:
-                    if board.tile(tile.position + direction) is not None:
-                        continue
-                    if board.tile(tile.position - direction) is not None:
-                        continue
-                    yield And(
-                        [
-                            SimpleConstraintGenerator._filter_can_build(
-                                self.words,
-                                letters + (tile.value,),
-                            ),
-                            Contains([tile.value]),
-                            _Anchor(tile.position, direction),
-                        ]
-                    )
+            for tile, direction in board.anchors():
+                before, after = board.anchor_span(
+                    tile.position, direction, len(letters)
+                )
+                # Past len(letters) squares on a side, the span has run
+                # through tiles in line, which words can use too.
+                in_line = dict[int, str]()
+                if before > len(letters) or after > len(letters):
+                    for offset in range(-before, after + 1):
+                        if offset and (
+                            line_tile := board.tile(tile.position + direction * offset)
+                        ):
+                            in_line[offset] = line_tile.value
+                yield And(
+                    [
+                        self._filter_can_build(
+                            letters + (tile.value,) + tuple(in_line.values())
+                        ),
+                        _Anchor(
+                            tile.position,
+                            direction,
+                            tile.value,
+                            before,
+                            after,
+                            self.cross_checks,
+                            in_line,
+                            Counter(letters),
+                        ),
+                    ]
+                )
@@ -1,7 +1,8 @@
 from typing import Iterable
 
 from banana.board import ACROSS, DOWN, Board, Position, Word
-from banana.reasoning import ConstraintGenerator
+from banana.reasoning import ConstraintGenerator, Lexicon
+from banana.reasoning.constraints import And
 from banana.reasoning.generators import SimpleConstraintGenerator
 
 
@@ -91,3 +92,75 @@ def test_anchor_attaches_at_end_of_new_word() -> None:
     assert list(_generate_candidates(board, cg, letters, words)) == [
         Word.from_str("EFB", Position(1, -2), DOWN)
     ]
+
+
+def test_anchor_respects_cross_checks() -> None:
+    board = Board.from_str(
+        """
+        AB
+         C
+        """
+    )
+    letters = "DE"
+    words = ["AB", "BC", "AD", "AE", "DC"]
+    cg = SimpleConstraintGenerator(words)
+    assert set(_generate_candidates(board, cg, letters, words)) == {
+        Word.from_str("AD", Position(0, 0), DOWN),
+        Word.from_str("DC", Position(0, 1), ACROSS),
+    }
+
+
+def test_shared_lexicon() -> None:
+    lexicon = Lexicon(["ABC", "CDE", "CDF"])
+    board = Board.from_str("ABC")
+    list(SimpleConstraintGenerator(lexicon).generate(board, "ED"))
+    misses = lexicon.cache.misses
+    generator = SimpleConstraintGenerator(lexicon)
+    assert generator.lexicon is lexicon
+    assert generator.words == frozenset(["ABC", "CDE", "CDF"])
+    list(generator.generate(board, "DE"))
+    assert lexicon.cache.misses == misses
+    assert lexicon.cache.hits > 0
+
+
+def test_anchor_plan() -> None:
+    cg = SimpleConstraintGenerator(["ABC", "CDE"])
+    constraint = next(iter(cg.generate(Board.from_str("ABC"), "DE")))
+    assert isinstance(constraint, And)
+    plan = [type(c).__name__ for c in constraint.plan]
+    assert plan == ["InSet", "_Anchor"]
+
+
+def test_anchor_runs_through_tiles_in_line() -> None:
+    board = Board.from_str(
+        """
+        ABC
+
+
+          D
+        """
+    )
+    words = ["ABC", "CX", "CXY", "CXYD"]
+    cg = SimpleConstraintGenerator(words)
+    # CXY would stop next to the D, so only the word through it is placed.
+    assert list(_generate_candidates(board, cg, "XY", words)) == [
+        Word.from_str("CX", Position(2, 0), DOWN),
+        Word.from_str("CXYD", Position(2, 0), DOWN),
+    ]
+
+
+def test_anchor_through_tiles_in_line_uses_only_the_hand() -> None:
+    board = Board.from_str(
+        """
+        ABC
+
+
+          D
+        """
+    )
+    words = ["ABC", "CD", "CXD", "CXYD", "CDXYD"]
+    cg = SimpleConstraintGenerator(words)
+    # CD and CXD would need a D from the hand, CDXYD runs into the D with X.
+    assert list(_generate_candidates(board, cg, "XY", words)) == [
+        Word.from_str("CXYD", Position(2, 0), DOWN)
+    ]
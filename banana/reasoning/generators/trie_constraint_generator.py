@@ -0,0 +1,107 @@
+from typing import Callable, Iterable, Optional, override
+
+from banana.board import Board, Direction, Position
+from banana.reasoning.constraint import Constraint
+from banana.reasoning.constraint_generator import ConstraintGenerator
+from banana.reasoning.constraints import And, Start
+from banana.reasoning.cross_checks import CrossChecks
+from banana.reasoning.generators.anchor_walk import AnchorWalk
+from banana.reasoning.trie import Trie
+
+
+class _TrieAnchor(AnchorWalk):
+    def __init__(
+        self,
+        trie: Trie,
+        board: Board,
+        position: Position,
+        direction: Direction,
+        letters: Iterable[str],
+        cross_checks: Optional[CrossChecks] = None,
+    ) -> None:
+        super().__init__(board, position, direction, letters, cross_checks)
+        self.trie = trie
+
+    @override
+    def __repr__(self) -> str:
+        return f"TrieAnchor({self.position}, {self.direction})"
+
+    @property
+    @override
+    def reach(self) -> int:
+        return self.trie.max_length
+
+    @override
+    def _walk(
+        self,
+        cells: list[Optional[str]],
+        hand: dict[str, int],
+        cross_check: Callable[[int], Optional[frozenset[str]]],
+        emit: Callable[[str, int], None],
+    ) -> None:
+        reach = self.reach
+
+        def walk(node: Trie.Node, start: int, i: int, used: int) -> None:
+            if (letter := cells[i]) is not None:
+                if (child := node.children.get(letter)) is not None:
+                    walk(child, start, i + 1, used)
+                return
+            if node.word is not None and i > reach and used:
+                emit(node.word, start)
+            if not node.children:
+                return
+            allowed = cross_check(i)
+            for letter, count in hand.items():
+                if not count or (child := node.children.get(letter)) is None:
+                    continue
+                if allowed is not None and letter not in allowed:
+                    continue
+                hand[letter] = count - 1
+                walk(child, start, i + 1, used + 1)
+                hand[letter] = count
+
+        # Every empty square before the anchor needs a letter from the hand.
+        empty = 0
+        for start in range(reach, 0, -1):
+            if cells[start] is None:
+                empty += 1
+                if empty > len(self.letters):
+                    break
+            if cells[start - 1] is None:
+                walk(self.trie.root, start, start, 0)
+
+
+class TrieConstraintGenerator(ConstraintGenerator):
+    def __init__(self, words: Iterable[str]) -> None:
+        self.words = frozenset(words)
+        self.trie = Trie(self.words)
+        self.cross_checks = CrossChecks(self.words)
+
+    @override
+    def __repr__(self) -> str:
+        return f"TrieConstraintGenerator({self.trie})"
+
+    @override
+    def count(self, board: Board, letters: Iterable[str]) -> int:
+        return len(board.anchors()) if len(board) else 1
+
+    @override
+    def generate(self, board: Board, letters: Iterable[str]) -> Iterable[Constraint]:
+        letters = tuple(letters)
+        if len(board) == 0:
+            yield And(
+                [
+                    ConstraintGenerator.filter_can_build(self.words, letters),
+                    Start(),
+                ]
+            )
+        else:
+            for tile, direction in board.anchors():
+                yield _TrieAnchor(
+                    self.trie,
+                    board,
+                    tile.position,
+                    direction,
+                    letters,
+                    self.cross_checks,
+                )
@@ -0,0 +1,160 @@
+import weakref
+from collections import Counter
+from functools import cached_property
+from typing import Iterable, Iterator, Optional, override
+
+from banana.reasoning.lru_cache import LRUCache
+
+
+class Lexicon:
+    # Words get ids in sorted order, and sets of words are ints with bit id
+    # set for each word in the set, so they combine with & and |.
+
+    def __init__(self, words: Iterable[str], cache_size: int = 10_000) -> None:
+        self.words = tuple(sorted(frozenset(words)))
+        self._fingerprint = hash(self.words)
+        self._same_words = weakref.WeakSet["Lexicon"]()
+        self.ids = {word: word_id for word_id, word in enumerate(self.words)}
+        self.all = (1 << len(self.words)) - 1
+        self.max_length = max(map(len, self.words), default=0)
+        # (letter, count) -> the words with at least count of letter.
+        ids = dict[tuple[str, int], list[int]]()
+        for word_id, word in enumerate(self.words):
+            for letter, count in Counter(word).items():
+                for k in range(1, count + 1):
+                    ids.setdefault((letter, k), []).append(word_id)
+        self._at_least = {key: self._bitset(key_ids) for key, key_ids in ids.items()}
+        self.alphabet = frozenset(letter for letter, _ in self._at_least)
+        self._letters = sorted(self.alphabet)
+        self._max_counts = Counter[str]()
+        for letter, count in self._at_least:
+            self._max_counts[letter] = max(self._max_counts[letter], count)
+        # can_build masks by key(), shared by everything using this lexicon.
+        self.cache = LRUCache[tuple[int, ...], int](cache_size)
+        # fitting() masks by (letter, before, after), capped at max_length.
+        self._fitting = dict[tuple[str, int, int], int]()
+
+    @cached_property
+    def _at_offset(self) -> dict[tuple[str, int], int]:
+        # (letter, offset) -> the words with letter at offset; built on first
+        # use, since only anchor lookups need it.
+        ids = dict[tuple[str, int], list[int]]()
+        for word_id, word in enumerate(self.words):
+            for offset, letter in enumerate(word):
+                ids.setdefault((letter, offset), []).append(word_id)
+        return {key: self._bitset(key_ids) for key, key_ids in ids.items()}
+
+    @cached_property
+    def _up_to(self) -> list[int]:
+        # length -> the words no longer than length.
+        ids = [list[int]() for _ in range(self.max_length + 1)]
+        for word_id, word in enumerate(self.words):
+            ids[len(word)].append(word_id)
+        up_to = list[int]()
+        mask = 0
+        for length_ids in ids:
+            mask |= self._bitset(length_ids)
+            up_to.append(mask)
+        return up_to
+
+    def _bitset(self, ids: Iterable[int]) -> int:
+        # Built as bytes, since or-ing bits into a growing int is quadratic.
+        bitmap = bytearray((len(self.words) + 7) // 8)
+        for word_id in ids:
+            bitmap[word_id >> 3] |= 1 << (word_id & 7)
+        return int.from_bytes(bitmap, "little")
+
+    @override
+    def __repr__(self) -> str:
+        return f"Lexicon(words={len(self)}, cache={self.cache})"
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word: object) -> bool:
+        return word in self.ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.words)
+
+    def same_words(self, other: "Lexicon") -> bool:
+        # Lexicons with the same words assign the same ids, so their masks
+        # are interchangeable.
+        if other is self or other in self._same_words:
+            return True
+        if other._fingerprint != self._fingerprint or other.words != self.words:
+            return False
+        self._same_words.add(other)
+        return True
+
+    def mask(self, words: Iterable[str]) -> int:
+        return self._bitset(
+            word_id for word in words if (word_id := self.ids.get(word)) is not None
+        )
+
+    def at_least(self, letter: str, count: int = 1) -> int:
+        if count < 1:
+            return self.all
+        return self._at_least.get((letter, count), 0)
+
+    def containing(self, letters: Iterable[str]) -> int:
+        mask = self.all
+        for letter, count in Counter(letters).items():
+            mask &= self.at_least(letter, count)
+        return mask
+
+    def at(self, letter: str, offset: int) -> int:
+        return self._at_offset.get((letter, offset), 0)
+
+    def of_length(self, shortest: int, longest: Optional[int] = None) -> int:
+        # Words of length shortest, or of shortest up to longest inclusive.
+        longest = min(shortest if longest is None else longest, self.max_length)
+        if shortest > longest:
+            return 0
+        if shortest < 1:
+            return self._up_to[longest]
+        return self._up_to[longest] & ~self._up_to[shortest - 1]
+
+    def fitting(self, letter: str, before: Optional[int], after: Optional[int]) -> int:
+        # The words that can pass through an anchor holding letter, lined up
+        # on some occurrence of it, with at most before letters ahead of it
+        # and after letters past it (None for no limit).
+        limit = max(self.max_length - 1, 0)
+        before = limit if before is None else min(before, limit)
+        after = limit if after is None else min(after, limit)
+        key = (letter, before, after)
+        if (mask := self._fitting.get(key)) is None:
+            mask = 0
+            for offset in range(before + 1):
+                mask |= self.at(letter, offset) & self.of_length(
+                    offset + 1, offset + 1 + after
+                )
+            self._fitting[key] = mask
+        return mask
+
+    def key(self, letters: Iterable[str]) -> tuple[int, ...]:
+        # A hand's count of each letter of the alphabet, capped at the most
+        # any word needs: hands with the same key can build the same words.
+        counts = Counter(letters)
+        return tuple(
+            min(counts[letter], self._max_counts[letter]) for letter in self._letters
+        )
+
+    def can_build(self, letters: Iterable[str]) -> int:
+        key = self.key(letters)
+        if (mask := self.cache.get(key)) is None:
+            mask = self.all
+            for letter, count in zip(self._letters, key, strict=True):
+                mask &= ~self._at_least.get((letter, count + 1), 0)
+            self.cache.put(key, mask)
+        return mask
+
+    def select(self, mask: int) -> list[str]:
+        # Reversed binary digits, so digit i is the bit of word word_id i.
+        bits = bin(mask)[:1:-1]
+        words = list[str]()
+        word_id = bits.find("1")
+        while word_id != -1:
+            words.append(self.words[word_id])
+            word_id = bits.find("1", word_id + 1)
+        return words
@@ -0,0 +1,159 @@
+from typing import Optional
+
+from pytest_subtests import SubTests
+
+from banana.reasoning import Lexicon
+
+
+def test_words() -> None:
+    lexicon = Lexicon(["BC", "AB", "AD", "AB"])
+    assert lexicon.words == ("AB", "AD", "BC")
+    assert lexicon.ids == {"AB": 0, "AD": 1, "BC": 2}
+    assert list(lexicon) == ["AB", "AD", "BC"]
+    assert len(lexicon) == 3
+    assert "AB" in lexicon
+    assert "CD" not in lexicon
+    assert lexicon.alphabet == frozenset("ABCD")
+
+
+def test_mask_and_select() -> None:
+    lexicon = Lexicon(["AB", "AD", "BC"])
+    assert lexicon.mask(["BC", "AB", "XY"]) == 0b101
+    assert lexicon.select(0b101) == ["AB", "BC"]
+    assert lexicon.select(lexicon.all) == ["AB", "AD", "BC"]
+    assert lexicon.select(0) == []
+
+
+def test_at_least(subtests: SubTests) -> None:
+    lexicon = Lexicon(["AB", "AAB", "AAAB", "B"])
+    for letter, count, expected in list[tuple[str, int, list[str]]](
+        [
+            ("A", 0, ["AAAB", "AAB", "AB", "B"]),
+            ("A", 1, ["AAAB", "AAB", "AB"]),
+            ("A", 2, ["AAAB", "AAB"]),
+            ("A", 4, []),
+            ("Z", 1, []),
+        ]
+    ):
+        with subtests.test(letter=letter, count=count):
+            assert lexicon.select(lexicon.at_least(letter, count)) == expected
+
+
+def test_at(subtests: SubTests) -> None:
+    lexicon = Lexicon(["AB", "BA", "ABA", "B"])
+    assert lexicon.max_length == 3
+    for letter, offset, expected in list[tuple[str, int, list[str]]](
+        [
+            ("A", 0, ["AB", "ABA"]),
+            ("A", 1, ["BA"]),
+            ("A", 2, ["ABA"]),
+            ("B", 0, ["B", "BA"]),
+            ("A", 3, []),
+            ("Z", 0, []),
+        ]
+    ):
+        with subtests.test(letter=letter, offset=offset):
+            assert lexicon.select(lexicon.at(letter, offset)) == expected
+
+
+def test_of_length(subtests: SubTests) -> None:
+    lexicon = Lexicon(["AB", "BA", "ABA", "B", "ABBA"])
+    for shortest, longest, expected in list[tuple[int, Optional[int], list[str]]](
+        [
+            (2, None, ["AB", "BA"]),
+            (1, 2, ["AB", "B", "BA"]),
+            (0, 3, ["AB", "ABA", "B", "BA"]),
+            (3, 10, ["ABA", "ABBA"]),
+            (5, None, []),
+            (3, 2, []),
+        ]
+    ):
+        with subtests.test(shortest=shortest, longest=longest):
+            assert lexicon.select(lexicon.of_length(shortest, longest)) == expected
+
+
+def test_fitting(subtests: SubTests) -> None:
+    lexicon = Lexicon(["AB", "BA", "ABA", "B", "CAB"])
+    for letter, before, after, expected in list[
+        tuple[str, Optional[int], Optional[int], list[str]]
+    ](
+        [
+            ("A", None, None, ["AB", "ABA", "BA", "CAB"]),
+            ("A", 0, None, ["AB", "ABA"]),
+            ("A", 0, 1, ["AB"]),
+            ("A", 1, 0, ["BA"]),
+            ("A", 2, 0, ["ABA", "BA"]),
+            ("B", 0, 0, ["B"]),
+            ("B", 2, 0, ["AB", "B", "CAB"]),
+            ("Z", None, None, []),
+        ]
+    ):
+        with subtests.test(letter=letter, before=before, after=after):
+            assert lexicon.select(lexicon.fitting(letter, before, after)) == expected
+            assert lexicon.fitting(letter, before, after) == lexicon.fitting(
+                letter, before, after
+            )
+    assert Lexicon([]).fitting("A", None, None) == 0
+
+
+def test_can_build(subtests: SubTests) -> None:
+    lexicon = Lexicon(["AB", "BC", "AD", "AAB", "ABBA"])
+    for letters, expected in list[tuple[str, list[str]]](
+        [
+            ("ABC", ["AB", "BC"]),
+            ("CBA", ["AB", "BC"]),
+            ("AAB", ["AAB", "AB"]),
+            ("AABB", ["AAB", "AB", "ABBA"]),
+            ("XYZ", []),
+            ("", []),
+        ]
+    ):
+        with subtests.test(letters=letters):
+            assert lexicon.select(lexicon.can_build(letters)) == expected
+
+
+def test_key() -> None:
+    lexicon = Lexicon(["AB", "AAB"])
+    assert lexicon.key("BA") == lexicon.key("AB")
+    assert lexicon.key("AAAAB") == lexicon.key("AAB")
+    assert lexicon.key("ABZ") == lexicon.key("AB")
+    assert lexicon.key("AB") != lexicon.key("AAB")
+
+
+def test_can_build_cache() -> None:
+    lexicon = Lexicon(["AB", "BC", "AD"], cache_size=2)
+    assert lexicon.can_build("ABC") == lexicon.can_build("CBAZ")
+    assert (lexicon.cache.hits, lexicon.cache.misses) == (1, 1)
+    lexicon.can_build("AD")
+    lexicon.can_build("BC")
+    assert len(lexicon.cache) == 2
+    assert lexicon.cache.evictions == 1
+    lexicon.can_build("ABC")
+    assert lexicon.cache.misses == 4
+
+
+def test_containing(subtests: SubTests) -> None:
+    lexicon = Lexicon(["AB", "BC", "ABA", "CD"])
+    for letters, expected in list[tuple[str, list[str]]](
+        [
+            ("A", ["AB", "ABA"]),
+            ("AB", ["AB", "ABA"]),
+            ("AA", ["ABA"]),
+            ("C", ["BC", "CD"]),
+            ("", ["AB", "ABA", "BC", "CD"]),
+            ("Z", []),
+        ]
+    ):
+        with subtests.test(letters=letters):
+            assert lexicon.select(lexicon.containing(letters)) == expected
+
+
+def test_same_words() -> None:
+    lexicon = Lexicon(["AB", "BC"])
+    assert lexicon.same_words(lexicon)
+    assert lexicon.same_words(Lexicon(["BC", "AB", "AB"]))
+    same = Lexicon(["AB", "BC"])
+    assert lexicon.same_words(same)
+    assert lexicon.same_words(same)
+    assert not lexicon.same_words(Lexicon(["AB"]))
+    assert not lexicon.same_words(Lexicon(["AB", "CD"]))
@@ -0,0 +1,64 @@
+from collections import OrderedDict
+from typing import Optional, override
+
+
+class LRUCache[K, V]:
+    class Error(Exception): ...
+
+    class ValueError(Error, ValueError): ...
+
+    def __init__(self, max_size: int) -> None:
+        if max_size < 1:
+            raise self.ValueError(f"max_size must be positive, not {max_size}")
+        self.max_size = max_size
+        self._entries = OrderedDict[K, V]()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @override
+    def __repr__(self) -> str:
+        return (
+            f"LRUCache(max_size={self.max_size}, "
+            f"size={len(self)}, "
+            f"hits={self.hits}, "
+            f"misses={self.misses}, "
+            f"evictions={self.evictions})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0
+
+    @property
+    def miss_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.misses / lookups if lookups else 0
+
+    def get(self, key: K) -> Optional[V]:
+        if key not in self._entries:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key: K, value: V) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
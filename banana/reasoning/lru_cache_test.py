@@ -0,0 +1,54 @@
+import pytest
+
+from banana.reasoning import LRUCache
+
+
+def test_invalid_max_size() -> None:
+    with pytest.raises(LRUCache.ValueError):
+        LRUCache[str, int](0)
+
+
+def test_get_put() -> None:
+    cache = LRUCache[str, int](2)
+    assert cache.get("a") is None
+    cache.put("a", 1)
+    assert "a" in cache
+    assert cache.get("a") == 1
+    assert len(cache) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_rate == 0.5
+    assert cache.miss_rate == 0.5
+
+
+def test_evicts_least_recently_used() -> None:
+    cache = LRUCache[str, int](2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+    assert cache.evictions == 1
+
+
+def test_rates_without_lookups() -> None:
+    cache = LRUCache[str, int](1)
+    assert cache.hit_rate == 0
+    assert cache.miss_rate == 0
+
+
+def test_clear() -> None:
+    cache = LRUCache[str, int](1)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses, cache.evictions) == (0, 0, 0)
+
+
+def test_repr() -> None:
+    assert repr(LRUCache[str, int](3)) == (
+        "LRUCache(max_size=3, size=0, hits=0, misses=0, evictions=0)"
+    )
@@ -1,21 +1,23 @@
 from abc import ABC, abstractmethod
 from collections import Counter
-from typing import Iterable
+from typing import Iterable, Union
 
-from banana.board import Board, Word
+from banana.board import Board, Placement, Word
+from banana.reasoning.lexicon import Lexicon
 
 
 class Search(ABC):
     def __init__(self, words: Iterable[str]) -> None:
-        self.words = frozenset(words)
+        self.lexicon = words if isinstance(words, Lexicon) else Lexicon(words)
+        self.words = frozenset(self.lexicon)
 
-    def _board_is_valid(self, board: Board) -> bool:
-        return {word.value for word in board.get_words()}.issubset(self.words)
+    def _placement_is_valid(self, board: Board, word: Union[Word, Placement]) -> bool:
+        return all(formed in self.words for formed in board.words_formed_by(word))
 
     def _letters_without_word(
         self,
         board: Board,
-        word: Word,
+        word: Union[Word, Placement],
         letters: Iterable[str],
     ) -> Iterable[str]:
         letters_consumed = board.get_letters_consumed(word)
@@ -1,18 +1,27 @@
+import heapq
+import math
 from collections import Counter
 from dataclasses import dataclass
-from typing import Iterable, override
+from operator import mul
+from typing import Iterable, Mapping, Optional, override
 
-from banana.board import Board
+from banana.board import Board, Placement, Position
 from banana.reasoning.constraint import Constraint
 from banana.reasoning.constraint_generator import ConstraintGenerator
 from banana.reasoning.search import Search
+from banana.reasoning.transposition_table import TranspositionTable
 
 
 @dataclass(frozen=True)
 class _Node:
     board: Board
     letters: list[str]
-    constraints: list[Constraint]
+    # What _score needs from the board, carried from parent to child.
+    tiles: int
+    rarity: float
+    word_length: int
+    words: int
+    bounds: tuple[Position, Position]
 
 
 class BeamSearch(Search):
@@ -20,6 +29,31 @@ class BeamSearch(Search):
 
     class SearchError(Error, RuntimeError): ...
 
+    class ValueError(Error, ValueError): ...
+
+    class FeatureError(Error, AssertionError): ...
+
+    # What _score weighs, in the order of _features() and weights; each has
+    # a <name>_weight argument.
+    FEATURES = (
+        "remaining_letters",
+        "board_size",
+        "average_word_length",
+        "constraints",
+        "letter_rarity",
+    )
+
+    @dataclass
+    class Stats:
+        # Children scored, and constraint sets generated for them: only
+        # nodes that stay in the beam until expanded get constraints.
+        scored: int = 0
+        generated: int = 0
+
+        @property
+        def skipped(self) -> int:
+            return self.scored - self.generated
+
     def __init__(
         self,
         words: Iterable[str],
@@ -41,8 +75,24 @@ class BeamSearch(Search):
         # Heuristic weight for the rarity of letters.
         # Positive values encourage using rarer letters.
         letter_rarity_weight: float = 1.5,
+        # Optional table of visited boards used to drop duplicate nodes.
+        transposition_table: Optional[TranspositionTable] = None,
+        # Collapse nodes whose boards only differ by translation.
+        deduplicate_translations: bool = False,
+        # Also collapse nodes whose boards are transposes of each other.
+        deduplicate_transpositions: bool = False,
+        # Finish the layer a solution turns up in and return its best-scoring
+        # solution, instead of the first one found.
+        best_solution_in_layer: bool = False,
+        # Check every node's incrementally updated features against the
+        # board, for debugging.
+        verify_features: bool = False,
+        # Weights by FEATURES name, overriding the <name>_weight arguments.
+        weights: Optional[Mapping[str, float]] = None,
     ) -> None:
         super().__init__(words)
+        if beam_size < 1:
+            raise self.ValueError(f"beam_size must be at least 1, got {beam_size}")
         self.constraint_generator = constraint_generator
         self.beam_size = beam_size
         self.max_depth = max_depth
@@ -58,6 +108,17 @@ class BeamSearch(Search):
         self.average_word_length_weight = average_word_length_weight
         self.constraints_weight = constraints_weight
         self.letter_rarity_weight = letter_rarity_weight
+        self.transposition_table = transposition_table
+        self.deduplicate_translations = deduplicate_translations
+        self.deduplicate_transpositions = deduplicate_transpositions
+        self.best_solution_in_layer = best_solution_in_layer
+        self.verify_features = verify_features
+        for name, weight in (weights or {}).items():
+            if name not in BeamSearch.FEATURES:
+                raise self.ValueError(f"Unknown feature: {name}")
+            setattr(self, f"{name}_weight", weight)
+        # For the last search.
+        self.stats = BeamSearch.Stats()
 
     @override
     def __str__(self) -> str:
@@ -70,78 +131,229 @@ class BeamSearch(Search):
             f"  average_word_length_weight={self.average_word_length_weight}\n"
             f"  constraints_weight={self.constraints_weight}\n"
             f"  letter_rarity_weight={self.letter_rarity_weight}\n"
+            f"  transposition_table={self.transposition_table}\n"
+            f"  deduplicate_translations={self.deduplicate_translations}\n"
+            f"  deduplicate_transpositions={self.deduplicate_transpositions}\n"
+            f"  best_solution_in_layer={self.best_solution_in_layer}\n"
+            f"  verify_features={self.verify_features}\n"
         )
 
-    def _node(
+    def _node(self, board: Board, letters: list[str]) -> _Node:
+        words = list(board.get_words())
+        return _Node(
+            board,
+            letters,
+            len(board),
+            sum(self.inverse_letter_density.get(tile.value, 0) for tile in board),
+            sum(map(len, words)),
+            len(words),
+            board.bounds(),
+        )
+
+    def _child(
         self,
+        node: _Node,
+        placement: Placement,
         board: Board,
         letters: list[str],
+        consumed: list[str],
     ) -> _Node:
-        return _Node(
+        # node's features updated for placement, which turned node.board into
+        # board using the consumed letters.
+        word_length, words = self._word_changes(node.board, placement)
+        start = placement.position
+        end = start + placement.direction * (len(placement) - 1)
+        lower, upper = node.bounds if node.tiles else (start, start)
+        child = _Node(
             board,
             letters,
-            list(self.constraint_generator.generate(board, letters)),
+            node.tiles + len(consumed),
+            node.rarity
+            + sum(self.inverse_letter_density.get(letter, 0) for letter in consumed),
+            node.word_length + word_length,
+            node.words + words,
+            (
+                Position.of(min(lower.x, start.x, end.x), min(lower.y, start.y, end.y)),
+                Position.of(max(upper.x, start.x, end.x), max(upper.y, start.y, end.y)),
+            ),
         )
+        if self.verify_features:
+            self._verify(child)
+        return child
+
+    @staticmethod
+    def _word_changes(board: Board, placement: Placement) -> tuple[int, int]:
+        # How placement changes the total length and number of board's words.
+        # Every word it removes or adds runs through one of its squares, so
+        # only the runs next to them on board are looked at.
+        direction = placement.direction
+        orthogonal = direction.orthogonal()
+        length = words = 0
+
+        def replace(old: Iterable[int], new: int) -> None:
+            nonlocal length, words
+            for run in old:
+                if run >= 2:
+                    length -= run
+                    words -= 1
+            if new >= 2:
+                length += new
+                words += 1
+
+        end = placement.position + direction * (len(placement) - 1)
+        before = len(board.fragments(placement.position, direction)[0])
+        after = len(board.fragments(end, direction)[1])
+        # The runs along direction that the placed word joins into one.
+        runs = list[int]()
+        run = before
+        for position in placement.positions():
+            if board.occupied(position):
+                run += 1
+                continue
+            runs.append(run)
+            run = 0
+            above, below = map(len, board.fragments(position, orthogonal))
+            replace((above, below), above + 1 + below)
+        runs.append(run + after)
+        replace(runs, before + len(placement) + after)
+        return length, words
+
+    def _verify(self, node: _Node) -> None:
+        expected = self._node(node.board, node.letters)
+        if (
+            node.tiles != expected.tiles
+            or not math.isclose(node.rarity, expected.rarity)
+            or node.word_length != expected.word_length
+            or node.words != expected.words
+            or node.bounds != expected.bounds
+        ):
+            raise self.FeatureError(f"Features {node} should be {expected}")
+
+    def _constraints(self, node: _Node) -> Iterable[Constraint]:
+        self.stats.generated += 1
+        return self.constraint_generator.generate(node.board, node.letters)
 
     def _expand(self, node: _Node) -> Iterable[_Node]:
-        for constraint in node.constraints:
-            for word in constraint.filter(self.words):
-                for candidate in constraint.create_candidates(
+        for constraint in self._constraints(node):
+            for word in constraint.select(self.lexicon):
+                for candidate in constraint.create_placements(
                     node.board,
                     word,
                 ):
                     if not node.board.can_place_word(candidate):
                         continue
-                    candidate_board = node.board.copy()
-                    candidate_board.place_word(candidate)
-                    if node.board == candidate_board:
+                    consumed = node.board.get_letters_consumed(candidate)
+                    if not consumed:
                         continue
-                    if not self._board_is_valid(candidate_board):
+                    if not self._placement_is_valid(node.board, candidate):
+                        continue
+                    candidate_board = node.board.copy()
+                    candidate_board.place_word(candidate, validate=False)
+                    candidate_letters = list(
+                        self._letters_without_word(
+                            node.board,
+                            candidate,
+                            node.letters,
+                        )
+                    )
+                    if (
+                        self.transposition_table is not None
+                        and self.transposition_table.visit(
+                            candidate_board,
+                            candidate_letters,
+                        )
+                    ):
                         continue
-                    candidate_letters = self._letters_without_word(
-                        node.board,
-                        candidate,
-                        node.letters,
+                    yield self._child(
+                        node, candidate, candidate_board, candidate_letters, consumed
                     )
-                    yield self._node(candidate_board, list(candidate_letters))
-
-    def _score(self, node: _Node) -> float:
-        words = list(node.board.get_words())
-        average_word_length = sum(map(len, words)) / len(words) if words else 0
-        letters = [tile.value for tile in node.board]
-        average_letter_rarity = (
-            sum(self.inverse_letter_density.get(letter, 0) for letter in letters)
-            / len(letters)
-            if letters
-            else 0
+
+    def _deduplicate(self, nodes: Iterable[_Node]) -> Iterable[_Node]:
+        if not (self.deduplicate_translations or self.deduplicate_transpositions):
+            yield from nodes
+            return
+        seen = set[tuple[int, tuple[str, ...]]]()
+        for node in nodes:
+            key = (
+                node.board.canonical_hash(transpose=self.deduplicate_transpositions),
+                tuple(sorted(node.letters)),
+            )
+            if key not in seen:
+                seen.add(key)
+                yield node
+
+    def _select(self, nodes: Iterable[_Node]) -> tuple[list[_Node], Optional[Board]]:
+        # The beam_size best children, best first and earliest first among
+        # equals, scored as they come, and a solution if one turns up. Stops
+        # at the first solution unless best_solution_in_layer is set.
+        heap = list[tuple[float, int, _Node]]()
+        solution: Optional[tuple[float, int, Board]] = None
+        for i, node in enumerate(nodes):
+            self.stats.scored += 1
+            if not node.letters and not self.best_solution_in_layer:
+                return [], node.board
+            score = self._score(
+                node, self.constraint_generator.count(node.board, node.letters)
+            )
+            if not node.letters:
+                if solution is None or (score, -i) > solution[:2]:
+                    solution = (score, -i, node.board)
+                continue
+            if len(heap) >= self.beam_size and (score, -i) <= heap[0][:2]:
+                continue
+            entry = (score, -i, node)
+            if len(heap) < self.beam_size:
+                heapq.heappush(heap, entry)
+            else:
+                heapq.heapreplace(heap, entry)
+        beam = [node for _, _, node in sorted(heap, reverse=True)]
+        return beam, solution[2] if solution is not None else None
+
+    @property
+    def weights(self) -> tuple[float, ...]:
+        return (
+            self.remaining_letters_weight,
+            self.board_size_weight,
+            self.average_word_length_weight,
+            self.constraints_weight,
+            self.letter_rarity_weight,
         )
-        min_pos, max_pos = node.board.bounds()
+
+    def _features(self, node: _Node, constraint_count: int) -> tuple[float, ...]:
+        min_pos, max_pos = node.bounds
         board_area = (max_pos.x - min_pos.x + 1) * (max_pos.y - min_pos.y + 1)
-        board_density = len(node.board) / board_area
         return (
-            self.remaining_letters_weight * len(node.letters)
-            + self.board_size_weight * board_density
-            + self.average_word_length_weight * average_word_length
-            + self.constraints_weight * len(node.constraints)
-            + self.letter_rarity_weight * average_letter_rarity
+            len(node.letters),
+            node.tiles / board_area,
+            node.word_length / node.words if node.words else 0,
+            constraint_count,
+            node.rarity / node.tiles if node.tiles else 0,
         )
 
+    def _score(self, node: _Node, constraint_count: int) -> float:
+        return sum(map(mul, self.weights, self._features(node, constraint_count)))
+
     @override
     def search(self, board: Board, letters: Iterable[str]) -> Board:
-        letters = list(letters)
-        beam = [self._node(board, letters)]
+        self.stats = BeamSearch.Stats()
+        # Visited boards are only duplicates within one search.
+        if self.transposition_table is not None:
+            self.transposition_table.clear()
+        beam, solution = self._select([self._node(board, list(letters))])
         depth = 1
-        while beam and (self.max_depth <= 0 or depth <= self.max_depth):
-            beam = sorted(
-                beam,
-                key=lambda node: self._score(node),
-                reverse=True,
-            )[: self.beam_size]
-            for node in beam:
-                if not node.letters:
-                    return node.board
-            beam = [
-                expanded_node for node in beam for expanded_node in self._expand(node)
-            ]
+        # Solutions are caught as their layer is selected, so the layer at
+        # max_depth is the last one worth expanding into.
+        while (
+            solution is None
+            and beam
+            and (self.max_depth <= 0 or depth < self.max_depth)
+        ):
+            beam, solution = self._select(
+                self._deduplicate(
+                    child for node in beam for child in self._expand(node)
+                )
+            )
             depth += 1
-        raise self.SearchError("Search failed to find a solution.")
+        if solution is None:
+            raise self.SearchError("Search failed to find a solution.")
+        return solution
@@ -1,11 +1,16 @@
-from typing import Iterable, override
+from typing import Iterable, Optional, override
 
 import pytest
+from pytest_subtests import SubTests
 
-from banana.board import Board, Position
-from banana.reasoning import Constraint, ConstraintGenerator
+from banana.board import ACROSS, DOWN, Board, Direction, Placement, Position, Word
+from banana.reasoning import Constraint, ConstraintGenerator, TranspositionTable
 from banana.reasoning.constraints import Start
-from banana.reasoning.generators import SimpleConstraintGenerator
+from banana.reasoning.generators import (
+    GaddagConstraintGenerator,
+    SimpleConstraintGenerator,
+    TrieConstraintGenerator,
+)
 from banana.reasoning.searches.beam_search import BeamSearch
 
 
@@ -118,3 +123,298 @@ def test_invalid_board() -> None:
     search = BeamSearch(words, OnlyStarts())
     with pytest.raises(BeamSearch.SearchError):
         search.search(board, letters)
+
+
+def test_transposition_table() -> None:
+    board = Board.from_str("AB")
+    letters = "CD"
+    words = ["AB", "AC", "BD", "CD"]
+    table = TranspositionTable()
+    search = BeamSearch(
+        words,
+        SimpleConstraintGenerator(words),
+        transposition_table=table,
+        best_solution_in_layer=True,
+    )
+    result = search.search(board, letters)
+    assert result == Board.from_str(
+        """
+        AB
+        CD
+        """
+    )
+    assert table.hits > 0
+
+
+def test_transposition_table_is_per_search() -> None:
+    board = Board.from_str("AB")
+    words = ["AB", "AC", "BD", "CD"]
+    search = BeamSearch(
+        words,
+        SimpleConstraintGenerator(words),
+        transposition_table=TranspositionTable(),
+    )
+    first = search.search(board, "CD")
+    assert search.search(board, "CD") == first
+
+
+class ShiftedStart(Constraint):
+    def __init__(self, direction: Direction) -> None:
+        self.direction = direction
+
+    @override
+    def create_candidates(self, board: Board, word: str) -> Iterable[Word]:
+        yield Word.from_str(word, Position(5, 5), self.direction)
+
+
+class CountingConstraint(Constraint):
+    def __init__(self) -> None:
+        self.count = 0
+
+    @override
+    def filter(self, words: Iterable[str]) -> Iterable[str]:
+        self.count += 1
+        return []
+
+
+class TwoStarts(ConstraintGenerator):
+    def __init__(self, direction: Direction) -> None:
+        self.direction = direction
+        self.expansions = CountingConstraint()
+
+    @override
+    def generate(self, board: Board, letters: Iterable[str]) -> Iterable[Constraint]:
+        if board:
+            yield self.expansions
+        else:
+            yield Start()
+            yield ShiftedStart(self.direction)
+
+
+def test_deduplicate(subtests: SubTests) -> None:
+    for direction, translations, transpositions, expected in list[
+        tuple[Direction, bool, bool, int]
+    ](
+        [
+            (ACROSS, False, False, 2),
+            (ACROSS, True, False, 1),
+            (DOWN, True, False, 2),
+            (DOWN, False, True, 1),
+        ]
+    ):
+        with subtests.test(
+            direction=direction,
+            translations=translations,
+            transpositions=transpositions,
+            expected=expected,
+        ):
+            generator = TwoStarts(direction)
+            search = BeamSearch(
+                ["AB"],
+                generator,
+                deduplicate_translations=translations,
+                deduplicate_transpositions=transpositions,
+            )
+            with pytest.raises(BeamSearch.SearchError):
+                search.search(Board([]), "ABX")
+            assert generator.expansions.count == expected
+
+
+class CountingGenerator(SimpleConstraintGenerator):
+    def __init__(self, words: Iterable[str]) -> None:
+        super().__init__(words)
+        self.counted = 0
+        self.generated = 0
+
+    @override
+    def count(self, board: Board, letters: Iterable[str]) -> int:
+        self.counted += 1
+        return super().count(board, letters)
+
+    @override
+    def generate(self, board: Board, letters: Iterable[str]) -> Iterable[Constraint]:
+        self.generated += 1
+        return super().generate(board, letters)
+
+
+def test_beam_size_bounds_generation(subtests: SubTests) -> None:
+    words = ["CAB", "BAD", "CAD", "DAB", "AD", "BA", "AB"]
+    for beam_size in 1, 2, 100:
+        with subtests.test(beam_size=beam_size):
+            generator = CountingGenerator(words)
+            search = BeamSearch(words, generator, beam_size=beam_size)
+            result = search.search(Board.from_str("CAB"), "ADB")
+            assert len(result) == 6
+            assert generator.generated <= generator.counted
+            if beam_size < 100:
+                assert generator.generated < generator.counted
+
+
+def test_stats() -> None:
+    words = ["CAB", "BAD", "CAD", "DAB", "AD", "BA", "AB"]
+    generator = CountingGenerator(words)
+    search = BeamSearch(words, generator, beam_size=2)
+    search.search(Board.from_str("CAB"), "ADB")
+    stats = search.stats
+    assert stats.scored >= generator.counted
+    assert stats.generated == generator.generated
+    assert 0 < stats.generated < stats.scored
+    assert stats.skipped == stats.scored - stats.generated
+    search.search(Board.from_str("CAB"), "ADB")
+    assert search.stats == stats
+
+
+class FixedPlacements(Constraint, ConstraintGenerator):
+    def __init__(self, placements: list[Placement]) -> None:
+        self.placements = placements
+
+    @override
+    def generate(self, board: Board, letters: Iterable[str]) -> Iterable[Constraint]:
+        yield self
+
+    @override
+    def create_placements(self, board: Board, word: str) -> Iterable[Placement]:
+        return [placement for placement in self.placements if placement.value == word]
+
+
+def test_solution_in_layer(subtests: SubTests) -> None:
+    # Both finish the board; the square is denser, but ACD is found first.
+    words = ["AB", "AC", "ACD", "BD", "CD"]
+    generator = FixedPlacements(
+        [
+            Placement("CD", Position(0, 1), ACROSS),
+            Placement("ACD", Position(0, 0), DOWN),
+        ]
+    )
+    square = Board.from_str(
+        """
+        AB
+        CD
+        """
+    )
+    l_shape = Board.from_str(
+        """
+        AB
+        C
+        D
+        """
+    )
+    for best_solution_in_layer, expected, scored in list[tuple[bool, Board, int]](
+        [
+            (False, l_shape, 2),
+            (True, square, 3),
+        ]
+    ):
+        with subtests.test(best_solution_in_layer=best_solution_in_layer):
+            search = BeamSearch(
+                words,
+                generator,
+                average_word_length_weight=0,
+                best_solution_in_layer=best_solution_in_layer,
+            )
+            assert search.search(Board.from_str("AB"), "CD") == expected
+            assert search.stats.scored == scored
+
+
+def test_max_depth() -> None:
+    search = BeamSearch(["AB"], TwoStarts(DOWN), max_depth=1)
+    with pytest.raises(BeamSearch.SearchError):
+        search.search(Board([]), "AB")
+    search.max_depth = 2
+    assert search.search(Board([]), "AB") == Board.from_str("AB")
+    assert search.search(Board.from_str("AB"), "") == Board.from_str("AB")
+
+
+def test_verify_features(subtests: SubTests) -> None:
+    words = [
+        "CAB", "BAD", "CAD", "DAB", "AD", "BA", "AB", "ABS", "CABS", "SCAB",
+        "TAB", "BAT", "BATS", "STAB", "ACT", "CAT", "CATS", "AT", "AS", "TA",
+    ]  # fmt: skip
+    for name, generator in list[tuple[str, ConstraintGenerator]](
+        [
+            ("simple", SimpleConstraintGenerator(words)),
+            ("trie", TrieConstraintGenerator(words)),
+            ("gaddag", GaddagConstraintGenerator(words)),
+        ]
+    ):
+        for board, letters in list[tuple[Board, str]](
+            [
+                (Board([]), "CABSTAD"),
+                (Board.from_str("CAB"), "STADT"),
+            ]
+        ):
+            with subtests.test(generator=name, board=board, letters=letters):
+                search = BeamSearch(
+                    words, generator, beam_size=20, verify_features=True
+                )
+                try:
+                    search.search(board, letters)
+                except BeamSearch.SearchError:
+                    pass
+                assert search.stats.scored > 1
+
+
+class StaleDensity(SimpleConstraintGenerator):
+    def __init__(self, words: Iterable[str]) -> None:
+        super().__init__(words)
+        self.search: Optional[BeamSearch] = None
+
+    @override
+    def generate(self, board: Board, letters: Iterable[str]) -> Iterable[Constraint]:
+        if self.search is not None:
+            # Change rarities under the search, so its running sums go stale.
+            self.search.inverse_letter_density = {"C": 0.5}
+        return super().generate(board, letters)
+
+
+def test_verify_features_through_words_in_line() -> None:
+    board = Board.from_str(
+        """
+        A  CD
+        B
+        """
+    )
+    words = ["AB", "CD", "AXYCD"]
+    search = BeamSearch(words, SimpleConstraintGenerator(words), verify_features=True)
+    assert search.search(board, "XY") == Board.from_str(
+        """
+        AXYCD
+        B
+        """
+    )
+
+
+def test_verify_features_detects_drift() -> None:
+    words = ["CAB", "BAD"]
+    generator = StaleDensity(words)
+    search = BeamSearch(words, generator, verify_features=True)
+    generator.search = search
+    with pytest.raises(BeamSearch.FeatureError):
+        search.search(Board.from_str("CAB"), "AD")
+
+
+def test_weights() -> None:
+    search = BeamSearch(
+        ["AB"],
+        OnlyStarts(),
+        board_size_weight=3,
+        weights={"constraints": 2, "letter_rarity": 0},
+    )
+    assert len(search.weights) == len(BeamSearch.FEATURES)
+    assert dict(zip(BeamSearch.FEATURES, search.weights, strict=True)) == {
+        "remaining_letters": -2,
+        "board_size": 3,
+        "average_word_length": 1,
+        "constraints": 2,
+        "letter_rarity": 0,
+    }
+    assert search.constraints_weight == 2
+    with pytest.raises(BeamSearch.ValueError):
+        BeamSearch(["AB"], OnlyStarts(), weights={"tiles": 1})
+
+
+def test_beam_size_must_be_positive(subtests: SubTests) -> None:
+    for beam_size in 0, -1:
+        with subtests.test(beam_size=beam_size):
+            with pytest.raises(BeamSearch.ValueError):
+                BeamSearch(["AB"], OnlyStarts(), beam_size=beam_size)
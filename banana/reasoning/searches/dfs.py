@@ -1,8 +1,9 @@
 from typing import Iterable, Optional, override
 
-from banana.board import Board
+from banana.board import Board, WorkingBoard
 from banana.reasoning.constraint_generator import ConstraintGenerator
 from banana.reasoning.search import Search
+from banana.reasoning.transposition_table import TranspositionTable
 
 
 class DFS(Search):
@@ -14,38 +15,50 @@ class DFS(Search):
         self,
         words: Iterable[str],
         constraint_generator: ConstraintGenerator,
+        transposition_table: Optional[TranspositionTable] = None,
     ) -> None:
         super().__init__(words)
         self.constraint_generator = constraint_generator
+        self.transposition_table = transposition_table
 
-    def _search(self, board: Board, letters: list[str]) -> Optional[Board]:
+    def _search(self, board: WorkingBoard, letters: list[str]) -> Optional[Board]:
         if not letters:
-            return board
+            return board.freeze()
+        # DFS returns on the first solution, so a state seen before in this
+        # search has failed.
+        if self.transposition_table is not None and self.transposition_table.visit(
+            board, letters
+        ):
+            return None
 
         constraints = self.constraint_generator.generate(board, letters)
         for constraint in constraints:
-            for word in constraint.filter(self.words):
-                for candidate in constraint.create_candidates(board, word):
+            for word in constraint.select(self.lexicon):
+                for candidate in constraint.create_placements(board, word):
                     if not board.can_place_word(candidate):
                         continue
-                    candidate_board = board.copy()
-                    candidate_board.place_word(candidate)
-                    if candidate_board == board:
+                    if not board.get_letters_consumed(candidate):
                         continue
-                    if not self._board_is_valid(candidate_board):
+                    if not self._placement_is_valid(board, candidate):
                         continue
                     candidate_letters = self._letters_without_word(
                         board, candidate, letters
                     )
-                    candidate_solution = self._search(
-                        candidate_board,
-                        list(candidate_letters),
-                    )
+                    board.place_word(candidate, validate=False)
+                    try:
+                        candidate_solution = self._search(
+                            board,
+                            list(candidate_letters),
+                        )
+                    finally:
+                        board.undo()
                     if candidate_solution is not None:
                         return candidate_solution
 
     @override
     def search(self, board: Board, letters: Iterable[str]) -> Board:
-        if result := self._search(board, list(letters)):
+        if self.transposition_table is not None:
+            self.transposition_table.clear()
+        if result := self._search(WorkingBoard(board), list(letters)):
             return result
         raise self.SearchError("No solution found")
@@ -3,7 +3,7 @@ from typing import Iterable, override
 import pytest
 
 from banana.board import Board, Position
-from banana.reasoning import Constraint, ConstraintGenerator
+from banana.reasoning import Constraint, ConstraintGenerator, TranspositionTable
 from banana.reasoning.constraints import Start
 from banana.reasoning.generators import SimpleConstraintGenerator
 from banana.reasoning.searches.dfs import DFS
@@ -106,3 +106,24 @@ def test_invalid_board() -> None:
     search = DFS(words, OnlyStarts())
     with pytest.raises(DFS.SearchError):
         search.search(board, letters)
+
+
+def test_transposition_table() -> None:
+    # AD and CE can be placed in either order, leaving an unusable Z.
+    board = Board.from_str("ABC")
+    letters = "DEZ"
+    words = ["ABC", "AD", "CE"]
+    table = TranspositionTable()
+    search = DFS(words, SimpleConstraintGenerator(words), table)
+    with pytest.raises(DFS.SearchError):
+        search.search(board, letters)
+    assert table.hits > 0
+
+
+def test_transposition_table_is_per_search() -> None:
+    board = Board.from_str("ABC")
+    words = ["ABC", "AD", "CE"]
+    table = TranspositionTable()
+    search = DFS(words, SimpleConstraintGenerator(words), table)
+    first = search.search(board, "DE")
+    assert search.search(board, "DE") == first
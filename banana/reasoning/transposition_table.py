@@ -0,0 +1,51 @@
+from typing import Iterable, override
+
+from banana.board import Board
+from banana.reasoning.lru_cache import LRUCache
+
+
+class TranspositionTable:
+    def __init__(self, max_size: int = 1_000_000) -> None:
+        self._cache = LRUCache[tuple[int, tuple[str, ...]], bool](max_size)
+
+    @override
+    def __repr__(self) -> str:
+        return (
+            f"TranspositionTable(max_size={self.max_size}, "
+            f"size={len(self)}, "
+            f"hit_rate={self.hit_rate:.2f}, "
+            f"miss_rate={self.miss_rate:.2f})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def max_size(self) -> int:
+        return self._cache.max_size
+
+    @property
+    def hits(self) -> int:
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self._cache.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self._cache.hit_rate
+
+    @property
+    def miss_rate(self) -> float:
+        return self._cache.miss_rate
+
+    def visit(self, board: Board, letters: Iterable[str]) -> bool:
+        key = (board.zobrist_hash, tuple(sorted(letters)))
+        if self._cache.get(key):
+            return True
+        self._cache.put(key, True)
+        return False
+
+    def clear(self) -> None:
+        self._cache.clear()
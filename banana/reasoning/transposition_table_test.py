@@ -0,0 +1,37 @@
+from banana.board import Board
+from banana.reasoning import TranspositionTable
+
+
+def test_visit() -> None:
+    table = TranspositionTable()
+    assert not table.visit(Board.from_str("AB"), "CD")
+    assert table.visit(Board.from_str("AB"), "DC")
+    assert not table.visit(Board.from_str("AB"), "CE")
+    assert not table.visit(Board.from_str("BA"), "CD")
+    assert len(table) == 3
+    assert (table.hits, table.misses) == (1, 3)
+    assert table.hit_rate == 0.25
+    assert table.miss_rate == 0.75
+
+
+def test_eviction() -> None:
+    table = TranspositionTable(max_size=1)
+    assert not table.visit(Board.from_str("AB"), "")
+    assert not table.visit(Board.from_str("BA"), "")
+    assert not table.visit(Board.from_str("AB"), "")
+    assert table.max_size == 1
+    assert len(table) == 1
+
+
+def test_clear() -> None:
+    table = TranspositionTable()
+    table.visit(Board.from_str("AB"), "")
+    table.clear()
+    assert len(table) == 0
+    assert not table.visit(Board.from_str("AB"), "")
+
+
+def test_repr() -> None:
+    assert repr(TranspositionTable(max_size=10)) == (
+        "TranspositionTable(max_size=10, size=0, hit_rate=0.00, miss_rate=0.00)"
+    )
@@ -0,0 +1,50 @@
+from typing import Iterable, Iterator, Optional, override
+
+
+class Trie:
+    class Node:
+        __slots__ = ("children", "word")
+
+        def __init__(self) -> None:
+            self.children = dict[str, "Trie.Node"]()
+            self.word: Optional[str] = None
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self.root = Trie.Node()
+        self._len = 0
+        self.max_length = 0
+        # Sorted so that walks visit words in the same order on every run.
+        for word in sorted(frozenset(words)):
+            node = self.root
+            for letter in word:
+                node = node.children.setdefault(letter, Trie.Node())
+            node.word = word
+            self._len += 1
+            self.max_length = max(self.max_length, len(word))
+
+    @override
+    def __repr__(self) -> str:
+        return f"Trie(words={len(self)})"
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str) or (node := self.find(word)) is None:
+            return False
+        return node.word is not None
+
+    def __iter__(self) -> Iterator[str]:
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.word is not None:
+                yield node.word
+            stack.extend(reversed(node.children.values()))
+
+    def find(self, prefix: str) -> Optional["Trie.Node"]:
+        node = self.root
+        for letter in prefix:
+            if (node := node.children.get(letter)) is None:
+                return None
+        return node
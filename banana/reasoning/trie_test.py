@@ -0,0 +1,27 @@
+from banana.reasoning import Trie
+
+
+def test_len_iter() -> None:
+    trie = Trie(["CAT", "CA", "DOG", "CAT"])
+    assert len(trie) == 3
+    assert list(trie) == ["CA", "CAT", "DOG"]
+    assert trie.max_length == 3
+
+
+def test_contains() -> None:
+    trie = Trie(["CAT", "CA"])
+    assert "CA" in trie
+    assert "CAT" in trie
+    assert "C" not in trie
+    assert "CATS" not in trie
+    assert 1 not in trie
+
+
+def test_find() -> None:
+    trie = Trie(["CAT", "CAR"])
+    node = trie.find("CA")
+    assert node is not None
+    assert node.word is None
+    assert list(node.children) == ["R", "T"]
+    assert trie.find("CX") is None
+    assert trie.find("") is trie.root
@@ -2,8 +2,13 @@ import argparse
 import random
 from collections import Counter
 
-from banana.board import Board
-from banana.reasoning.generators import SimpleConstraintGenerator
+from banana.board import Board, GridBoard
+from banana.reasoning import Lexicon, TranspositionTable
+from banana.reasoning.generators import (
+    GaddagConstraintGenerator,
+    SimpleConstraintGenerator,
+    TrieConstraintGenerator,
+)
 from banana.reasoning.searches import BeamSearch
 from banana.validation import validate_word
 
@@ -52,6 +57,28 @@ def parse_args():
         default=0,
         help="Maximum depth for beam search. 0 to disable.",
     )
+    parser.add_argument(
+        "--generator",
+        choices=["simple", "trie", "gaddag"],
+        default="simple",
+        help="Constraint generator used to propose moves.",
+    )
+    parser.add_argument(
+        "--transposition_table_size",
+        type=int,
+        default=0,
+        help="Maximum size of the transposition table. 0 to disable.",
+    )
+    parser.add_argument(
+        "--best_solution_in_layer",
+        action="store_true",
+        help="Return the best solution in the layer, not the first one found.",
+    )
+    parser.add_argument(
+        "--grid_board",
+        action="store_true",
+        help="Search with GridBoard, which keeps board copies small.",
+    )
     return parser.parse_args()
 
 
@@ -123,13 +150,29 @@ def main():
     ]
     letters = make_letters(args, words)
 
-    board = Board.from_str(args.start) if args.start else Board([])
+    board_type = GridBoard if args.grid_board else Board
+    board = board_type.from_str(args.start) if args.start else board_type([])
 
+    transposition_table = (
+        TranspositionTable(args.transposition_table_size)
+        if args.transposition_table_size
+        else None
+    )
+    lexicon = Lexicon(words)
+    match args.generator:
+        case "trie":
+            constraint_generator = TrieConstraintGenerator(lexicon)
+        case "gaddag":
+            constraint_generator = GaddagConstraintGenerator(lexicon)
+        case _:
+            constraint_generator = SimpleConstraintGenerator(lexicon)
     search = BeamSearch(
-        words,
-        SimpleConstraintGenerator(words),
+        lexicon,
+        constraint_generator,
         beam_size=args.beam_size,
         max_depth=args.max_depth,
+        transposition_table=transposition_table,
+        best_solution_in_layer=args.best_solution_in_layer,
     )
     try:
         result = search.search(board, letters)
@@ -137,6 +180,12 @@ def main():
         print(result)
     except BeamSearch.SearchError as e:
         print(f"No solution found: {e}")
+    print(
+        f"Scored {search.stats.scored} nodes, generated constraints for "
+        f"{search.stats.generated}, skipped {search.stats.skipped}"
+    )
+    if transposition_table is not None:
+        print(transposition_table)
 
 
 if __name__ == "__main__":
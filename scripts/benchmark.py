@@ -0,0 +1,418 @@
+import argparse
+import random
+import time
+import timeit
+import tracemalloc
+from typing import Callable
+
+from tabulate import tabulate
+
+from banana.board import (
+    ACROSS,
+    DOWN,
+    Board,
+    Direction,
+    GridBoard,
+    Position,
+    Tile,
+    Word,
+)
+from banana.reasoning import ConstraintGenerator, Lexicon
+from banana.reasoning.generators import (
+    GaddagConstraintGenerator,
+    SimpleConstraintGenerator,
+    TrieConstraintGenerator,
+)
+from banana.validation import validate_word
+
+# A hand-written board, roughly the size of a finished hand.
+_BOARD = """
+    FLOWER   Q
+    A    A   U
+    B   JOKE I
+    R    S   Z
+    I    T   Z
+    CHEAPEST E
+    S        S
+      SPHINX
+"""
+_PLACED = Word.from_str("NAY", Position(10, 7), DOWN)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run banana microbenchmarks.")
+    parser.add_argument(
+        "--number",
+        type=int,
+        default=1000,
+        help="Number of timed iterations per measurement.",
+    )
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+    subparsers.add_parser(
+        "board",
+        help="Compare the dict backed Board with GridBoard.",
+    )
+    subparsers.add_parser(
+        "occupancy",
+        help="Compare per-square tile probes with the occupancy bitboards.",
+    )
+    subparsers.add_parser(
+        "allocations",
+        help="Compare constructing anchor candidates with interned value objects.",
+    )
+    generators = subparsers.add_parser(
+        "generators",
+        help="Compare constraint generators on build time and per-node generation.",
+    )
+    generators.add_argument(
+        "--words",
+        type=argparse.FileType("r"),
+        default="words/3000.txt",
+        help="Path to a file containing valid words, one per line.",
+    )
+    generators.add_argument(
+        "--synthetic_words",
+        type=int,
+        default=0,
+        help="Number of random words to add to the lexicon, to mimic a large one.",
+    )
+    generators.add_argument(
+        "--letters",
+        type=str,
+        default="AEINRST",
+        help="Letters in hand for the generation benchmark.",
+    )
+    lexicon = subparsers.add_parser(
+        "lexicon",
+        help="Compare Counter filtering with Lexicon bitsets for filter_can_build.",
+    )
+    lexicon.add_argument(
+        "--words",
+        type=argparse.FileType("r"),
+        default="words/3000.txt",
+        help="Path to a file containing valid words, one per line.",
+    )
+    lexicon.add_argument(
+        "--synthetic_words",
+        type=int,
+        default=250_000,
+        help="Size of the synthetic lexicon benchmarked next to the word list.",
+    )
+    lexicon.add_argument(
+        "--letters",
+        type=str,
+        default="AEINRSTBLO",
+        help="Letters in hand.",
+    )
+    return parser.parse_args()
+
+
+def _time(number: int, func: Callable[[], object]) -> float:
+    """Average microseconds per call."""
+    return timeit.timeit(func, number=number) / number * 1e6
+
+
+def _memory(func: Callable[[], object], copies: int = 100) -> float:
+    """Average bytes allocated per call."""
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    results = [func() for _ in range(copies)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return (end - start) / copies
+
+
+def _allocated_blocks(func: Callable[[], object]) -> int:
+    """Memory blocks still allocated by objects func's result keeps alive."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = func()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+    return sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+
+def _copy_and_place(board: Board) -> Board:
+    # A beam child: the parent's board with one more word on it.
+    child = board.copy()
+    child.place_word(_PLACED)
+    return child
+
+
+def _board_row(board_type: type[Board], number: int) -> dict[str, object]:
+    board = board_type.from_str(_BOARD)
+    words = list(board.get_words())
+    return {
+        "board": board_type.__name__,
+        "tiles": len(board),
+        "build_bytes": _memory(lambda: board_type.from_str(_BOARD)),
+        "copy_bytes": _memory(board.copy),
+        "copy_place_bytes": _memory(lambda: _copy_and_place(board)),
+        "copy_us": _time(number, board.copy),
+        "get_words_us": _time(
+            number,
+            lambda: list(board._get_words()),  # type: ignore
+        ),
+        "can_place_word_us": _time(
+            number,
+            lambda: [board.can_place_word(word) for word in words],
+        ),
+        "str_us": _time(number, lambda: str(board)),
+    }
+
+
+def benchmark_board(args: argparse.Namespace) -> None:
+    rows = [_board_row(board_type, args.number) for board_type in (Board, GridBoard)]
+    print(tabulate(rows, headers="keys", floatfmt=".1f", tablefmt="grid"))
+
+
+def _probe_is_open(board: Board, position: Position, direction: Direction) -> bool:
+    return (
+        board.tile(position + direction) is None
+        and board.tile(position - direction) is None
+    )
+
+
+def _probe_can_place_word(board: Board, word: Word) -> bool:
+    return all(
+        (tile := board.tile(word_tile.position)) is None
+        or tile.value == word_tile.value
+        for word_tile in word
+    )
+
+
+def benchmark_occupancy(args: argparse.Namespace) -> None:
+    board = Board.from_str(_BOARD)
+    lower, upper = board.bounds()
+    squares = [
+        (Position(x, y), direction)
+        for x in range(lower.x - 1, upper.x + 2)
+        for y in range(lower.y - 1, upper.y + 2)
+        for direction in (ACROSS, DOWN)
+    ]
+    words = [
+        Word.from_str("SEVEN", position, direction) for position, direction in squares
+    ]
+    rows = [
+        {
+            "operation": "is_open",
+            "checks": len(squares),
+            "probe_us": _time(
+                args.number,
+                lambda: [_probe_is_open(board, *square) for square in squares],
+            ),
+            "bitboard_us": _time(
+                args.number,
+                lambda: [board.is_open(*square) for square in squares],
+            ),
+        },
+        {
+            "operation": "can_place_word",
+            "checks": len(words),
+            "probe_us": _time(
+                args.number,
+                lambda: [_probe_can_place_word(board, word) for word in words],
+            ),
+            "bitboard_us": _time(
+                args.number,
+                lambda: [board.can_place_word(word) for word in words],
+            ),
+        },
+    ]
+    print(tabulate(rows, headers="keys", floatfmt=".1f", tablefmt="grid"))
+
+
+def _constructed_candidates(
+    word: str, position: Position, direction: Direction
+) -> list[Word]:
+    return [
+        Word(
+            Tile(
+                char,
+                Position(
+                    position.x + direction.dx * (j - i),
+                    position.y + direction.dy * (j - i),
+                ),
+            )
+            for j, char in enumerate(word)
+        )
+        for i in range(len(word))
+    ]
+
+
+def _interned_candidates(
+    word: str, position: Position, direction: Direction
+) -> list[Word]:
+    return [
+        Word.from_str(word, position - direction * i, direction)
+        for i in range(len(word))
+    ]
+
+
+def benchmark_allocations(args: argparse.Namespace) -> None:
+    board = Board.from_str(_BOARD)
+    anchors = [
+        (tile.position, direction)
+        for tile in board
+        for direction in (ACROSS, DOWN)
+        if board.is_open(tile.position, direction)
+    ]
+    words = ["BANANA", "SPLIT", "PEEL", "DUMP"]
+    rows = list[dict[str, object]]()
+    for name, candidates in (
+        ("constructed", _constructed_candidates),
+        ("interned", _interned_candidates),
+    ):
+
+        def generate(
+            candidates: Callable[[str, Position, Direction], list[Word]] = candidates,
+        ) -> list[Word]:
+            return [
+                candidate
+                for position, direction in anchors
+                for word in words
+                for candidate in candidates(word, position, direction)
+            ]
+
+        # Warm the intern caches so the steady state of a search is measured.
+        generate()
+        rows.append(
+            {
+                "objects": name,
+                "candidates": len(generate()),
+                "blocks": _allocated_blocks(generate),
+                "bytes": _memory(generate, copies=10),
+                "us": _time(args.number, generate),
+            }
+        )
+    print(tabulate(rows, headers="keys", floatfmt=".1f", tablefmt="grid"))
+
+
+GENERATORS: dict[str, Callable[[list[str]], ConstraintGenerator]] = {
+    "simple": SimpleConstraintGenerator,
+    "trie": TrieConstraintGenerator,
+    "gaddag": GaddagConstraintGenerator,
+}
+
+
+def _synthetic_words(words: list[str], count: int) -> list[str]:
+    # Random words with the lexicon's letter frequencies and lengths.
+    rng = random.Random(0)
+    letters = "".join(words)
+    return [
+        "".join(rng.choices(letters, k=len(rng.choice(words)))) for _ in range(count)
+    ]
+
+
+def _candidates(
+    cg: ConstraintGenerator, board: Board, letters: str, lexicon: Lexicon
+) -> int:
+    count = 0
+    for constraint in cg.generate(board, letters):
+        for word in constraint.select(lexicon):
+            for _ in constraint.create_placements(board, word):
+                count += 1
+    return count
+
+
+def benchmark_generators(args: argparse.Namespace) -> None:
+    words = [validate_word(word) for line in args.words for word in line.split()]
+    words += _synthetic_words(words, args.synthetic_words)
+    board = Board.from_str(_BOARD)
+    lexicon = Lexicon(words)
+    rows = list[dict[str, object]]()
+    for name, generator in GENERATORS.items():
+        start = time.perf_counter()
+        cg = generator(words)
+        build_s = time.perf_counter() - start
+        rows.append(
+            {
+                "generator": name,
+                "words": len(words),
+                "build_s": build_s,
+                "candidates": _candidates(cg, board, args.letters, lexicon),
+                "node_ms": _time(
+                    args.number,
+                    lambda cg=cg: _candidates(cg, board, args.letters, lexicon),
+                )
+                / 1000,
+            }
+        )
+    print(tabulate(rows, headers="keys", floatfmt=".3f", tablefmt="grid"))
+
+
+def _counter_can_build(words: list[str], letters: str) -> list[str]:
+    return list(
+        ConstraintGenerator.filter_can_build(words, letters).filter(words),
+    )
+
+
+def _uncached_can_build(lexicon: Lexicon, letters: str) -> int:
+    # Each call would be a cache hit after the first otherwise.
+    lexicon.cache.clear()
+    return lexicon.can_build(letters)
+
+
+def benchmark_lexicon(args: argparse.Namespace) -> None:
+    words = [validate_word(word) for line in args.words for word in line.split()]
+    rows = list[dict[str, object]]()
+    for name, lexicon_words in (
+        ("words", words),
+        ("synthetic", _synthetic_words(words, args.synthetic_words)),
+    ):
+        start = time.perf_counter()
+        lexicon = Lexicon(lexicon_words)
+        build_s = time.perf_counter() - start
+        rows.append(
+            {
+                "lexicon": name,
+                "words": len(lexicon),
+                "build_s": build_s,
+                "matches": len(lexicon.select(lexicon.can_build(args.letters))),
+                "counter_ms": _time(
+                    args.number,
+                    lambda lexicon_words=lexicon_words: _counter_can_build(
+                        lexicon_words, args.letters
+                    ),
+                )
+                / 1000,
+                "mask_ms": _time(
+                    args.number,
+                    lambda lexicon=lexicon: _uncached_can_build(lexicon, args.letters),
+                )
+                / 1000,
+                "mask_and_select_ms": _time(
+                    args.number,
+                    lambda lexicon=lexicon: lexicon.select(
+                        _uncached_can_build(lexicon, args.letters)
+                    ),
+                )
+                / 1000,
+                "cached_mask_ms": _time(
+                    args.number,
+                    lambda lexicon=lexicon: lexicon.can_build(args.letters),
+                )
+                / 1000,
+            }
+        )
+    print(tabulate(rows, headers="keys", floatfmt=".3f", tablefmt="grid"))
+
+
+BENCHMARKS: dict[str, Callable[[argparse.Namespace], None]] = {
+    "allocations": benchmark_allocations,
+    "board": benchmark_board,
+    "generators": benchmark_generators,
+    "lexicon": benchmark_lexicon,
+    "occupancy": benchmark_occupancy,
+}
+
+
+def main() -> None:
+    args = parse_args()
+    BENCHMARKS[args.benchmark](args)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,7 @@ from typing import Iterable, Optional, override
 from tabulate import tabulate
 
 from banana.board import Board
-from banana.reasoning import Search
+from banana.reasoning import Lexicon, Search
 from banana.reasoning.generators import SimpleConstraintGenerator
 from banana.reasoning.searches import BeamSearch
 from banana.validation import validate_letter, validate_word
@@ -296,13 +296,17 @@ def main() -> None:
         ]
         for words_filename in args.words
     }
+    # One lexicon per word list, so its searches share can_build results.
+    lexicons = {
+        words_filename: Lexicon(words) for words_filename, words in word_sets.items()
+    }
     experiments = [
         Experiment(search, letter_sets, board, words_filename)
-        for words_filename, words in word_sets.items()
+        for words_filename, lexicon in lexicons.items()
         for search in [
             BeamSearch(
-                words,
-                SimpleConstraintGenerator(words),
+                lexicon,
+                SimpleConstraintGenerator(lexicon),
                 beam_size=beam_size,
                 max_depth=max_depth,
                 remaining_letters_weight=remaining_letters_weight,
@@ -5,6 +5,7 @@ from typing import Callable
 import optuna
 
 from banana.board import Board
+from banana.reasoning import Lexicon
 from banana.reasoning.generators import SimpleConstraintGenerator
 from banana.reasoning.searches import BeamSearch
 from banana.validation import validate_word
@@ -63,41 +64,14 @@ def parse_args() -> argparse.Namespace:
         default=[1, 25],
         help="Range for beam size in objective function.",
     )
-    parser.add_argument(
-        "--remaining_letters_weight",
-        type=float,
-        nargs=2,
-        default=[-1, 1],
-        help="Range for remaining letters weight in objective function.",
-    )
-    parser.add_argument(
-        "--board_size_weight",
-        type=float,
-        nargs=2,
-        default=[-1, 1],
-        help="Range for board size weight in objective function.",
-    )
-    parser.add_argument(
-        "--average_word_length_weight",
-        type=float,
-        nargs=2,
-        default=[-1, 1],
-        help="Range for average word length weight in objective function.",
-    )
-    parser.add_argument(
-        "--constraints_weight",
-        type=float,
-        nargs=2,
-        default=[-1, 1],
-        help="Range for constraints weight in objective function.",
-    )
-    parser.add_argument(
-        "--letter_rarity_weight",
-        type=float,
-        nargs=2,
-        default=[-1, 1],
-        help="Range for letter rarity weight in objective function.",
-    )
+    for feature in BeamSearch.FEATURES:
+        parser.add_argument(
+            f"--{feature}_weight",
+            type=float,
+            nargs=2,
+            default=[-1, 1],
+            help=f"Range for {feature.replace('_', ' ')} weight in objective function.",
+        )
     return parser.parse_args()
 
 
@@ -120,6 +94,7 @@ def suggest_flag_float(
 def objective(
     args: argparse.Namespace,
     words: list[str],
+    lexicon: Lexicon,
 ) -> Callable[[optuna.trial.Trial], float]:
     def _objective(trial: optuna.trial.Trial) -> float:
         experiment = Experiment(
@@ -130,38 +105,17 @@ def objective(
             ).generate(),
             words_filename=args.words,
             search=BeamSearch(
-                constraint_generator=SimpleConstraintGenerator(words),
-                words=words,
+                constraint_generator=SimpleConstraintGenerator(lexicon),
+                words=lexicon,
                 beam_size=suggest_flag_int(
                     args,
                     trial,
                     "beam_size",
                 ),
-                remaining_letters_weight=suggest_flag_float(
-                    args,
-                    trial,
-                    "remaining_letters_weight",
-                ),
-                board_size_weight=suggest_flag_float(
-                    args,
-                    trial,
-                    "board_size_weight",
-                ),
-                average_word_length_weight=suggest_flag_float(
-                    args,
-                    trial,
-                    "average_word_length_weight",
-                ),
-                constraints_weight=suggest_flag_float(
-                    args,
-                    trial,
-                    "constraints_weight",
-                ),
-                letter_rarity_weight=suggest_flag_float(
-                    args,
-                    trial,
-                    "letter_rarity_weight",
-                ),
+                weights={
+                    feature: suggest_flag_float(args, trial, f"{feature}_weight")
+                    for feature in BeamSearch.FEATURES
+                },
             ),
         )
         results = list(experiment.run())
@@ -193,7 +147,7 @@ def main() -> None:
 
     study = optuna.create_study()
     study.optimize(
-        objective(args, words),
+        objective(args, words, Lexicon(words)),
         n_trials=args.num_trials,
     )
 